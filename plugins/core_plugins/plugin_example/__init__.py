@@ -13,13 +13,8 @@ class ExamplePlugin(PluginInterface):
     Beispiel-Plugin für PyArm.
     """
 
-    @property
-    def name(self) -> str:
-        return "Example Plugin"
-
-    @property
-    def version(self) -> str:
-        return "0.1.0"
+    name = "Example Plugin"
+    version = "0.1.0"
 
     def initialize(self, config: Dict[str, Any]) -> bool:
         """
@@ -26,27 +26,6 @@ FLOAT_TYPES_PARTS = [
 ]
 
 
-def _are_int(values: list[Any]) -> bool:
-    """
-    Check if the column are int values.
-    """
-    return all(types.is_int(value) for value in values)
-
-
-def _are_float(values: list[Any]) -> bool:
-    """
-    Check if the column are float values.
-    """
-    return all(types.is_float(value) for value in values)
-
-
-def _are_bool(values: list[Any]) -> bool:
-    """
-    Check if the column is a boolean.
-    """
-    return all(types.is_bool(value) for value in values)
-
-
 def _is_float_column(column: str) -> bool:
     """
     Check if the column name indicates a float value.
@@ -62,11 +41,15 @@ def _get_datatype(column: str, values: Iterable[Any]) -> DataType:
     Combines the dataframes into one dataframe.
     """
     values = [val for val in values if val is not None and str(val) != str(nan)]
-    if _are_int(values) and not _is_float_column(column):
+    candidates = types.ALL_FLAGS
+    if _is_float_column(column):
+        candidates &= ~types.INT_FLAG
+    flag = types.common_flag(values, candidates)
+    if flag == types.INT_FLAG:
         return DataType.INTEGER
-    if _are_float(values):
+    if flag == types.FLOAT_FLAG:
         return DataType.FLOAT
-    if _are_bool(values):
+    if flag == types.BOOL_FLAG:
         return DataType.BOOLEAN
     return DataType.STRING
 
@@ -86,9 +69,10 @@ def _clean_value(value: str) -> str:
 def _is_unit(column_parts: list[str], unit_values: list[str]) -> bool:
     """
     Check if the column is a meter.
+    The column parts are expected in lowercase.
     """
     for part in column_parts:
-        if part.lower() not in unit_values:
+        if part not in unit_values:
             continue
         return True
     return False
@@ -127,7 +111,7 @@ def get_unit_from_name(column: str) -> UnitEnum:
     Combines the dataframes into one dataframe.
     """
     parts = column.split(" ")
-    parts = [_clean_value(part) for part in parts if part]
+    parts = [_clean_value(part).lower() for part in parts if part]
     if _is_kilometer(parts):
         return UnitEnum.KILOMETER
     if _is_meter(parts):
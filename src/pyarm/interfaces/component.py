@@ -4,6 +4,8 @@ from pyarm.components.base import Component, ComponentType
 
 
 class IComponentModel(Protocol):
+    __slots__ = ()
+
     def add_component(self, component: Component) -> None:
         """
         Adds a component or replaces an existing one with the same name.
@@ -29,6 +29,9 @@ class PluginInterface(ABC):
     """
     Base interface for all plugins.
     Each plugin must implement this interface.
+
+    ``name`` and ``version`` may be overridden with plain class attributes.
+    Plugin discovery then reads them without instantiating the plugin.
     """
 
     @property
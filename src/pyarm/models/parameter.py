@@ -114,8 +114,22 @@ class Parameter(IComponentModel):
     """
     Represents a single parameter of an infrastructure element.
     Now with support for components, enabling metadata and other extensions.
+
+    The components dictionary may be shared with parameters derived through
+    unit conversion. It is copied on the first add or remove, so always use
+    ``add_component`` and ``remove_component`` to modify it.
     """
 
+    __slots__ = (
+        "name",
+        "value",
+        "datatype",
+        "process",
+        "_unit",
+        "components",
+        "_components_shared",
+    )
+
     def __init__(
         self,
         name: str,
@@ -132,6 +146,7 @@ class Parameter(IComponentModel):
         self._unit = unit
         self._update_unit(unit)
         self.components = components or {}
+        self._components_shared = False
 
     @property
     def has_value(self) -> bool:
@@ -307,7 +322,35 @@ class Parameter(IComponentModel):
 
         self.value = units.convert_unit(self.value, self.unit, unit)
 
+    def share_components(self, other: "Parameter") -> None:
+        """
+        Share the components of this parameter with another parameter.
+
+        Both parameters copy the dictionary before their next modification.
+
+        Parameters
+        ----------
+        other : Parameter
+            The parameter that receives the components
+        """
+        if not self.components:
+            # Never share an empty dict: nothing is marked as shared, so a later
+            # add_component would modify both parameters
+            other.components = {}
+            other._components_shared = False
+            return
+        other.components = self.components
+        self._components_shared = True
+        other._components_shared = True
+
+    def _own_components(self) -> None:
+        if not self._components_shared:
+            return
+        self.components = dict(self.components)
+        self._components_shared = False
+
     def add_component(self, component: Component) -> None:
+        self._own_components()
         self.components[component.name] = component
 
     def get_component(self, component_name: str) -> Optional[Component]:
@@ -318,6 +361,7 @@ class Parameter(IComponentModel):
 
     def remove_component(self, component_name: str) -> bool:
         if component_name in self.components:
+            self._own_components()
             del self.components[component_name]
             return True
         return False
@@ -349,11 +393,13 @@ class Parameter(IComponentModel):
             "datatype": self.datatype.value,
         }
 
-        if self.unit != UnitEnum.NONE:
-            result["unit"] = self.unit.value
+        unit = self._unit
+        if unit != UnitEnum.NONE:
+            result["unit"] = unit.value
 
-        if self.process:
-            result["process"] = self.process.value
+        process = self.process
+        if process:
+            result["process"] = process.value
 
         if self.components:
             result["components"] = {name: comp.to_dict() for name, comp in self.components.items()}
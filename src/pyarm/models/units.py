@@ -4,12 +4,115 @@ These functions reduce code duplication and improve maintainability.
 """
 
 import logging
+import math
+from fractions import Fraction
 
 from pyarm.models.parameter import DataType, Parameter, UnitCategory, UnitEnum
 
 logger = logging.getLogger(__name__)
 
 
+# Conversion factor from each unit to the base unit of its category
+# (meter, square meter, cubic meter, kilogram, newton, degree, decimal ratio,
+# second, pascal and meter per second) as exact fraction. Only radian has an
+# irrational factor. Temperature is handled separately because its units
+# differ by an offset and not by a factor.
+_BASE_FACTORS: dict[UnitCategory, dict[UnitEnum, Fraction | float]] = {
+    UnitCategory.LENGTH: {
+        UnitEnum.METER: Fraction(1),
+        UnitEnum.CENTIMETER: Fraction(1, 100),
+        UnitEnum.MILLIMETER: Fraction(1, 1000),
+        UnitEnum.KILOMETER: Fraction(1000),
+    },
+    UnitCategory.AREA: {
+        UnitEnum.SQUARE_METER: Fraction(1),
+        UnitEnum.SQUARE_CENTIMETER: Fraction(1, 10_000),
+        UnitEnum.SQUARE_MILLIMETER: Fraction(1, 1_000_000),
+        UnitEnum.SQUARE_KILOMETER: Fraction(1_000_000),
+        UnitEnum.HECTARE: Fraction(10_000),
+    },
+    UnitCategory.VOLUME: {
+        UnitEnum.CUBIC_METER: Fraction(1),
+        UnitEnum.CUBIC_CENTIMETER: Fraction(1, 1_000_000),
+        UnitEnum.CUBIC_MILLIMETER: Fraction(1, 1_000_000_000),
+        UnitEnum.LITER: Fraction(1, 1000),
+        UnitEnum.MILLILITER: Fraction(1, 1_000_000),
+    },
+    UnitCategory.MASS: {
+        UnitEnum.KILOGRAM: Fraction(1),
+        UnitEnum.GRAM: Fraction(1, 1000),
+        UnitEnum.MILLIGRAM: Fraction(1, 1_000_000),
+        UnitEnum.TON: Fraction(1000),
+    },
+    UnitCategory.FORCE: {
+        UnitEnum.NEWTON: Fraction(1),
+        UnitEnum.KILONEWTON: Fraction(1000),
+        UnitEnum.MEGANEWTON: Fraction(1_000_000),
+    },
+    UnitCategory.ANGLE: {
+        UnitEnum.DEGREE: Fraction(1),
+        UnitEnum.RADIAN: 180 / math.pi,
+        UnitEnum.GRAD: Fraction(9, 10),
+    },
+    UnitCategory.RATIO: {
+        UnitEnum.PERCENT: Fraction(1, 100),
+        UnitEnum.PROMILLE: Fraction(1, 1000),
+        UnitEnum.RATIO: Fraction(1),
+    },
+    UnitCategory.TIME: {
+        UnitEnum.SECOND: Fraction(1),
+        UnitEnum.MINUTE: Fraction(60),
+        UnitEnum.HOUR: Fraction(3600),
+        UnitEnum.DAY: Fraction(86400),
+    },
+    UnitCategory.PRESSURE: {
+        UnitEnum.PASCAL: Fraction(1),
+        UnitEnum.KILOPASCAL: Fraction(1000),
+        UnitEnum.MEGAPASCAL: Fraction(1_000_000),
+        UnitEnum.BAR: Fraction(100_000),
+    },
+    UnitCategory.VELOCITY: {
+        UnitEnum.METER_PER_SECOND: Fraction(1),
+        UnitEnum.KILOMETER_PER_HOUR: Fraction(1000, 3600),
+    },
+}
+
+_TEMPERATURE_UNITS = frozenset({UnitEnum.CELSIUS, UnitEnum.KELVIN})
+
+# Offset between degrees Celsius and Kelvin
+_KELVIN_OFFSET = 273.15
+
+_NUMERIC_DATATYPES = frozenset({DataType.FLOAT, DataType.INTEGER})
+
+_UNIT_CATEGORIES: dict[UnitEnum, UnitCategory] = {
+    unit: category for category, factors in _BASE_FACTORS.items() for unit in factors
+}
+_UNIT_CATEGORIES.update({unit: UnitCategory.TEMPERATURE for unit in _TEMPERATURE_UNITS})
+
+
+def _pair_factor(from_factor: Fraction | float, to_factor: Fraction | float) -> tuple[float, int]:
+    """
+    Returns multiplier and divisor converting between two units of a category.
+
+    Scales by a power of ten stay integers, so e.g. 3 mm are converted to
+    3 / 10 = 0.3 cm instead of 3 * 0.1. Other factors are converted to float
+    once per pair.
+    """
+    factor = from_factor / to_factor
+    if isinstance(factor, Fraction) and 1 in (factor.numerator, factor.denominator):
+        return factor.numerator, factor.denominator
+    return float(factor), 1
+
+
+# Multiplier and divisor for every (from_unit, to_unit) pair within the same category
+_PAIR_FACTOR: dict[tuple[UnitEnum, UnitEnum], tuple[float, int]] = {
+    (from_unit, to_unit): _pair_factor(from_factor, to_factor)
+    for factors in _BASE_FACTORS.values()
+    for from_unit, from_factor in factors.items()
+    for to_unit, to_factor in factors.items()
+}
+
+
 def get_unit_category(unit: UnitEnum) -> UnitCategory:
     """
     Determines the category of a unit.
@@ -24,64 +127,41 @@ def get_unit_category(unit: UnitEnum) -> UnitCategory:
     UnitCategory
         The category of the unit
     """
-    length_units = [UnitEnum.METER, UnitEnum.CENTIMETER, UnitEnum.MILLIMETER, UnitEnum.KILOMETER]
-
-    area_units = [
-        UnitEnum.SQUARE_METER,
-        UnitEnum.SQUARE_CENTIMETER,
-        UnitEnum.SQUARE_MILLIMETER,
-        UnitEnum.SQUARE_KILOMETER,
-        UnitEnum.HECTARE,
-    ]
-
-    volume_units = [
-        UnitEnum.CUBIC_METER,
-        UnitEnum.CUBIC_CENTIMETER,
-        UnitEnum.CUBIC_MILLIMETER,
-        UnitEnum.LITER,
-        UnitEnum.MILLILITER,
-    ]
-
-    mass_units = [UnitEnum.KILOGRAM, UnitEnum.GRAM, UnitEnum.MILLIGRAM, UnitEnum.TON]
-
-    force_units = [UnitEnum.NEWTON, UnitEnum.KILONEWTON, UnitEnum.MEGANEWTON]
-
-    angle_units = [UnitEnum.DEGREE, UnitEnum.RADIAN, UnitEnum.GRAD]
-
-    ratio_units = [UnitEnum.PERCENT, UnitEnum.PROMILLE, UnitEnum.RATIO]
-
-    time_units = [UnitEnum.SECOND, UnitEnum.MINUTE, UnitEnum.HOUR, UnitEnum.DAY]
-
-    temperature_units = [UnitEnum.CELSIUS, UnitEnum.KELVIN]
-
-    pressure_units = [UnitEnum.PASCAL, UnitEnum.KILOPASCAL, UnitEnum.MEGAPASCAL, UnitEnum.BAR]
-
-    velocity_units = [UnitEnum.METER_PER_SECOND, UnitEnum.KILOMETER_PER_HOUR]
-
-    if unit in length_units:
-        return UnitCategory.LENGTH
-    elif unit in area_units:
-        return UnitCategory.AREA
-    elif unit in volume_units:
-        return UnitCategory.VOLUME
-    elif unit in mass_units:
-        return UnitCategory.MASS
-    elif unit in force_units:
-        return UnitCategory.FORCE
-    elif unit in angle_units:
-        return UnitCategory.ANGLE
-    elif unit in ratio_units:
-        return UnitCategory.RATIO
-    elif unit in time_units:
-        return UnitCategory.TIME
-    elif unit in temperature_units:
-        return UnitCategory.TEMPERATURE
-    elif unit in pressure_units:
-        return UnitCategory.PRESSURE
-    elif unit in velocity_units:
-        return UnitCategory.VELOCITY
-    else:
-        return UnitCategory.UNKNOWN
+    return _UNIT_CATEGORIES.get(unit, UnitCategory.UNKNOWN)
+
+
+def can_convert_unit(from_unit: UnitEnum, to_unit: UnitEnum) -> bool:
+    """
+    Checks whether values can be converted from one unit to another.
+
+    Parameters
+    ----------
+    from_unit: UnitEnum
+        Source unit
+    to_unit: UnitEnum
+        Target unit
+
+    Returns
+    -------
+    bool
+        True if convert_unit supports the conversion, otherwise False
+    """
+    if from_unit == to_unit:
+        return True
+    if from_unit in _TEMPERATURE_UNITS:
+        return to_unit in _TEMPERATURE_UNITS
+    return (from_unit, to_unit) in _PAIR_FACTOR
+
+
+def _category_error(from_unit: UnitEnum, to_unit: UnitEnum) -> ValueError:
+    from_category = get_unit_category(from_unit)
+    to_category = get_unit_category(to_unit)
+    if from_category == to_category:
+        return ValueError(f"Conversion for {from_category.value} units is not supported")
+    return ValueError(
+        f"Cannot convert between different unit categories: "
+        f"{from_category.value} and {to_category.value}"
+    )
 
 
 def convert_unit(value: int | float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
@@ -111,240 +191,16 @@ def convert_unit(value: int | float, from_unit: UnitEnum, to_unit: UnitEnum) ->
     if from_unit == to_unit:
         return float(value)
 
-    # Check if units are from the same category
-    from_category = get_unit_category(from_unit)
-    to_category = get_unit_category(to_unit)
-
-    if from_category != to_category:
-        raise ValueError(
-            f"Cannot convert between different unit categories: "
-            f"{from_category.value} and {to_category.value}"
-        )
-
-    # Handle each category with its specific conversion logic
-    if from_category == UnitCategory.LENGTH:
-        return _convert_length(value, from_unit, to_unit)
-    elif from_category == UnitCategory.AREA:
-        return _convert_area(value, from_unit, to_unit)
-    elif from_category == UnitCategory.VOLUME:
-        return _convert_volume(value, from_unit, to_unit)
-    elif from_category == UnitCategory.MASS:
-        return _convert_mass(value, from_unit, to_unit)
-    elif from_category == UnitCategory.FORCE:
-        return _convert_force(value, from_unit, to_unit)
-    elif from_category == UnitCategory.ANGLE:
-        return _convert_angle(value, from_unit, to_unit)
-    elif from_category == UnitCategory.RATIO:
-        return _convert_ratio(value, from_unit, to_unit)
-    elif from_category == UnitCategory.TIME:
-        return _convert_time(value, from_unit, to_unit)
-    elif from_category == UnitCategory.TEMPERATURE:
+    if from_unit in _TEMPERATURE_UNITS:
+        if to_unit not in _TEMPERATURE_UNITS:
+            raise _category_error(from_unit, to_unit)
         return _convert_temperature(value, from_unit, to_unit)
-    elif from_category == UnitCategory.PRESSURE:
-        return _convert_pressure(value, from_unit, to_unit)
-    elif from_category == UnitCategory.VELOCITY:
-        return _convert_velocity(value, from_unit, to_unit)
-    else:
-        raise ValueError(f"Conversion for {from_category.value} units is not supported")
-
-
-def _convert_length(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert length units to meters first, then to target unit."""
-    # Convert to meters (base unit)
-    meters = value
-    if from_unit == UnitEnum.MILLIMETER:
-        meters = value / 1000
-    elif from_unit == UnitEnum.CENTIMETER:
-        meters = value / 100
-    elif from_unit == UnitEnum.KILOMETER:
-        meters = value * 1000
-
-    # Convert from meters to target unit
-    if to_unit == UnitEnum.METER:
-        return meters
-    elif to_unit == UnitEnum.MILLIMETER:
-        return meters * 1000
-    elif to_unit == UnitEnum.CENTIMETER:
-        return meters * 100
-    elif to_unit == UnitEnum.KILOMETER:
-        return meters / 1000
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
 
-def _convert_area(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert area units to square meters first, then to target unit."""
-    # Convert to square meters (base unit)
-    sq_meters = value
-    if from_unit == UnitEnum.SQUARE_MILLIMETER:
-        sq_meters = value / 1_000_000
-    elif from_unit == UnitEnum.SQUARE_CENTIMETER:
-        sq_meters = value / 10_000
-    elif from_unit == UnitEnum.SQUARE_KILOMETER:
-        sq_meters = value * 1_000_000
-    elif from_unit == UnitEnum.HECTARE:
-        sq_meters = value * 10_000
-
-    # Convert from square meters to target unit
-    if to_unit == UnitEnum.SQUARE_METER:
-        return sq_meters
-    elif to_unit == UnitEnum.SQUARE_MILLIMETER:
-        return sq_meters * 1_000_000
-    elif to_unit == UnitEnum.SQUARE_CENTIMETER:
-        return sq_meters * 10_000
-    elif to_unit == UnitEnum.SQUARE_KILOMETER:
-        return sq_meters / 1_000_000
-    elif to_unit == UnitEnum.HECTARE:
-        return sq_meters / 10_000
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_volume(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert volume units to cubic meters first, then to target unit."""
-    # Convert to cubic meters (base unit)
-    cubic_meters = value
-    if from_unit == UnitEnum.CUBIC_MILLIMETER:
-        cubic_meters = value / 1_000_000_000
-    elif from_unit == UnitEnum.CUBIC_CENTIMETER:
-        cubic_meters = value / 1_000_000
-    elif from_unit == UnitEnum.LITER:
-        cubic_meters = value / 1000
-    elif from_unit == UnitEnum.MILLILITER:
-        cubic_meters = value / 1_000_000
-
-    # Convert from cubic meters to target unit
-    if to_unit == UnitEnum.CUBIC_METER:
-        return cubic_meters
-    elif to_unit == UnitEnum.CUBIC_MILLIMETER:
-        return cubic_meters * 1_000_000_000
-    elif to_unit == UnitEnum.CUBIC_CENTIMETER:
-        return cubic_meters * 1_000_000
-    elif to_unit == UnitEnum.LITER:
-        return cubic_meters * 1000
-    elif to_unit == UnitEnum.MILLILITER:
-        return cubic_meters * 1_000_000
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_mass(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert mass units to kilograms first, then to target unit."""
-    # Convert to kilograms (base unit)
-    kg = value
-    if from_unit == UnitEnum.GRAM:
-        kg = value / 1000
-    elif from_unit == UnitEnum.MILLIGRAM:
-        kg = value / 1_000_000
-    elif from_unit == UnitEnum.TON:
-        kg = value * 1000
-
-    # Convert from kilograms to target unit
-    if to_unit == UnitEnum.KILOGRAM:
-        return kg
-    elif to_unit == UnitEnum.GRAM:
-        return kg * 1000
-    elif to_unit == UnitEnum.MILLIGRAM:
-        return kg * 1_000_000
-    elif to_unit == UnitEnum.TON:
-        return kg / 1000
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_force(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert force units to newtons first, then to target unit."""
-    # Convert to newtons (base unit)
-    newtons = value
-    if from_unit == UnitEnum.KILONEWTON:
-        newtons = value * 1000
-    elif from_unit == UnitEnum.MEGANEWTON:
-        newtons = value * 1_000_000
-
-    # Convert from newtons to target unit
-    if to_unit == UnitEnum.NEWTON:
-        return newtons
-    elif to_unit == UnitEnum.KILONEWTON:
-        return newtons / 1000
-    elif to_unit == UnitEnum.MEGANEWTON:
-        return newtons / 1_000_000
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_angle(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert angle units to radians first, then to target unit."""
-    # Convert to radians (base unit)
-    radians = value
-    if from_unit == UnitEnum.DEGREE:
-        import math
-
-        radians = value * (math.pi / 180)
-    elif from_unit == UnitEnum.GRAD:
-        import math
-
-        radians = value * (math.pi / 200)
-
-    # Convert from radians to target unit
-    if to_unit == UnitEnum.RADIAN:
-        return radians
-    elif to_unit == UnitEnum.DEGREE:
-        import math
-
-        return radians * (180 / math.pi)
-    elif to_unit == UnitEnum.GRAD:
-        import math
-
-        return radians * (200 / math.pi)
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_ratio(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert ratio units to decimal first, then to target unit."""
-    # Convert to decimal ratio (base unit)
-    decimal = value
-    if from_unit == UnitEnum.PERCENT:
-        decimal = value / 100
-    elif from_unit == UnitEnum.PROMILLE:
-        decimal = value / 1000
-    elif from_unit == UnitEnum.RATIO:
-        # Assume value is already decimal for ratio as we don't have context
-        decimal = value
-
-    # Convert from decimal to target unit
-    if to_unit == UnitEnum.PERCENT:
-        return decimal * 100
-    elif to_unit == UnitEnum.PROMILLE:
-        return decimal * 1000
-    elif to_unit == UnitEnum.RATIO:
-        return decimal
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_time(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert time units to seconds first, then to target unit."""
-    # Convert to seconds (base unit)
-    seconds = value
-    if from_unit == UnitEnum.MINUTE:
-        seconds = value * 60
-    elif from_unit == UnitEnum.HOUR:
-        seconds = value * 3600
-    elif from_unit == UnitEnum.DAY:
-        seconds = value * 86400
-
-    # Convert from seconds to target unit
-    if to_unit == UnitEnum.SECOND:
-        return seconds
-    elif to_unit == UnitEnum.MINUTE:
-        return seconds / 60
-    elif to_unit == UnitEnum.HOUR:
-        return seconds / 3600
-    elif to_unit == UnitEnum.DAY:
-        return seconds / 86400
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
+    factor = _PAIR_FACTOR.get((from_unit, to_unit))
+    if factor is None:
+        raise _category_error(from_unit, to_unit)
+    multiplier, divisor = factor
+    return value * multiplier / divisor
 
 
 def _convert_temperature(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
@@ -354,62 +210,15 @@ def _convert_temperature(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -
     # Special case for temperature conversions due to offsets
     if from_unit == to_unit:
         return value
-
-    # First convert to Kelvin (base unit)
-    kelvin = value
-    if from_unit == UnitEnum.CELSIUS:
-        kelvin = value + 273.15
-
-    # Then convert from Kelvin to target unit
-    if to_unit == UnitEnum.KELVIN:
-        return kelvin
-    elif to_unit == UnitEnum.CELSIUS:
-        return kelvin - 273.15
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_pressure(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert pressure units to pascals first, then to target unit."""
-    # Convert to pascals (base unit)
-    pascals = value
-    if from_unit == UnitEnum.KILOPASCAL:
-        pascals = value * 1000
-    elif from_unit == UnitEnum.MEGAPASCAL:
-        pascals = value * 1_000_000
-    elif from_unit == UnitEnum.BAR:
-        pascals = value * 100_000
-
-    # Convert from pascals to target unit
-    if to_unit == UnitEnum.PASCAL:
-        return pascals
-    elif to_unit == UnitEnum.KILOPASCAL:
-        return pascals / 1000
-    elif to_unit == UnitEnum.MEGAPASCAL:
-        return pascals / 1_000_000
-    elif to_unit == UnitEnum.BAR:
-        return pascals / 100_000
-
-    raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
-
-
-def _convert_velocity(value: float, from_unit: UnitEnum, to_unit: UnitEnum) -> float:
-    """Convert velocity units to meters per second first, then to target unit."""
-    # Convert to meters per second (base unit)
-    mps = value
-    if from_unit == UnitEnum.KILOMETER_PER_HOUR:
-        mps = value * (1000 / 3600)
-
-    # Convert from meters per second to target unit
-    if to_unit == UnitEnum.METER_PER_SECOND:
-        return mps
-    elif to_unit == UnitEnum.KILOMETER_PER_HOUR:
-        return mps * (3600 / 1000)
+    if from_unit == UnitEnum.CELSIUS and to_unit == UnitEnum.KELVIN:
+        return value + _KELVIN_OFFSET
+    if from_unit == UnitEnum.KELVIN and to_unit == UnitEnum.CELSIUS:
+        return value - _KELVIN_OFFSET
 
     raise ValueError(f"Conversion from {from_unit.value} to {to_unit.value} not implemented")
 
 
-def convert_parameter_unit(parameter: "Parameter", to_unit: UnitEnum) -> "Parameter":
+def convert_parameter_unit(parameter: Parameter, to_unit: UnitEnum) -> Parameter:
     """
     Convert a parameter to a different unit and return a new parameter with the converted value.
 
@@ -430,33 +239,32 @@ def convert_parameter_unit(parameter: "Parameter", to_unit: UnitEnum) -> "Parame
     ValueError
         If the conversion is not supported
     """
-    from pyarm.models.parameter import Parameter
-
     # No conversion needed if units are the same
     if parameter.unit == to_unit:
         return parameter
 
     # Check if the value is numeric
-    if parameter.datatype not in (DataType.FLOAT, DataType.INTEGER):
+    if parameter.datatype not in _NUMERIC_DATATYPES:
         raise ValueError(
             f"Cannot convert non-numeric parameter: {parameter.name} with type {parameter.datatype}"
         )
 
     # Convert the value
     converted_value = convert_unit(parameter.value, parameter.unit, to_unit)
-    return Parameter(
+    converted = Parameter(
         name=parameter.name,
         value=converted_value,
         datatype=parameter.datatype,
         process=parameter.process,
         unit=to_unit,
-        components=parameter.components.copy(),
     )
+    parameter.share_components(converted)
+    return converted
 
 
 def convert_parameter_list_units(
-    parameters: list["Parameter"], unit_map: dict[UnitEnum, UnitEnum]
-) -> list["Parameter"]:
+    parameters: list[Parameter], unit_map: dict[UnitEnum, UnitEnum]
+) -> list[Parameter]:
     """
     Convert units of parameters in a list according to a mapping.
 
@@ -472,25 +280,37 @@ def convert_parameter_list_units(
     list[Parameter]
         New list of parameters with converted units where applicable
     """
-    result = []
-
-    for param in parameters:
-        if param.unit in unit_map:
-            try:
-                converted = convert_parameter_unit(param, unit_map[param.unit])
-                result.append(converted)
-            except ValueError as e:
-                # Log error but keep original parameter
-                logger.warning(f"Could not convert parameter {param.name}: {e}")
-                result.append(param)
-        else:
+    result = list(parameters)
+
+    # Group convertible parameters by unit pair so each pair is checked only once
+    groups: dict[tuple[UnitEnum, UnitEnum], list[int]] = {}
+    for index, param in enumerate(parameters):
+        to_unit = unit_map.get(param.unit)
+        if to_unit is None or to_unit == param.unit:
             # No conversion needed, keep original
-            result.append(param)
+            continue
+        if param.datatype not in _NUMERIC_DATATYPES:
+            logger.warning(
+                f"Could not convert parameter {param.name}: "
+                f"Cannot convert non-numeric parameter with type {param.datatype}"
+            )
+            continue
+        groups.setdefault((param.unit, to_unit), []).append(index)
+
+    for (from_unit, to_unit), indices in groups.items():
+        if not can_convert_unit(from_unit, to_unit):
+            # Log error but keep original parameters
+            error = _category_error(from_unit, to_unit)
+            for index in indices:
+                logger.warning(f"Could not convert parameter {parameters[index].name}: {error}")
+            continue
+        for index in indices:
+            result[index] = convert_parameter_unit(parameters[index], to_unit)
 
     return result
 
 
-def standardize_units(parameters: list["Parameter"]) -> list["Parameter"]:
+def standardize_units(parameters: list[Parameter]) -> list[Parameter]:
     """
     Convert all parameters to standard SI units.
 
@@ -3,20 +3,104 @@ Plugin management module for PyArm.
 This module handles the discovery and management of plugins.
 """
 
+import copy
+import functools
 import importlib
+import importlib.metadata
 import importlib.util
+import inspect
 import json
 import logging
 import os
 import pkgutil
+import stat
 import sys
-from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from pyarm.interfaces.plugin import PluginInterface
 
 logger = logging.getLogger(__name__)
 
+_ENTRY_POINT_GROUP = "pyarm.plugins"
+
+# Parsed plugin configuration files keyed by path, with their modification time
+_CONFIG_CACHE: dict[str, tuple[int, dict[str, Any]]] = {}
+
+# Plugin classes found in plugin packages, keyed by package path,
+# with the modification time of the directory's __init__.py
+_PLUGIN_MODULE_CACHE: dict[str, tuple[int, tuple[type[PluginInterface], ...]]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _all_entry_points() -> importlib.metadata.EntryPoints:
+    """
+    Loads the entry points of all installed distributions once per process.
+
+    Returns
+    -------
+    importlib.metadata.EntryPoints
+        All installed entry points
+    """
+    return importlib.metadata.entry_points()
+
+
+def _valid_dir(path: str, checked: dict[str, bool]) -> bool:
+    """
+    Checks whether a plugin path is an existing directory.
+
+    The result is remembered in ``checked``, which lives for one discovery
+    run only, so directories created later are found by the next run.
+
+    Parameters
+    ----------
+    path: str
+        The path to check
+    checked: dict[str, bool]
+        The results of the paths already checked in this run
+
+    Returns
+    -------
+    bool
+        True if the path is an existing directory, otherwise False
+    """
+    is_dir = checked.get(path)
+    if is_dir is None:
+        is_dir = checked[path] = os.path.isdir(path)
+    return is_dir
+
+
+def _clear_caches() -> None:
+    """Clears all module-level plugin discovery caches."""
+    _all_entry_points.cache_clear()
+    _CONFIG_CACHE.clear()
+    _PLUGIN_MODULE_CACHE.clear()
+
+
+def _get_plugin_info(plugin_type: type[PluginInterface]) -> tuple[str, str]:
+    """
+    Returns name and version of a plugin class.
+
+    Name and version defined as class attributes are read without creating an
+    instance. Plugins that define them as properties are instantiated.
+
+    Parameters
+    ----------
+    plugin_type: type[PluginInterface]
+        The plugin class
+
+    Returns
+    -------
+    tuple[str, str]
+        Name and version of the plugin
+    """
+    name = inspect.getattr_static(plugin_type, "name", None)
+    version = inspect.getattr_static(plugin_type, "version", None)
+    if isinstance(name, str) and isinstance(version, str):
+        return name, version
+    plugin_instance = plugin_type()
+    return plugin_instance.name, plugin_instance.version
+
 
 def discover_plugins() -> dict[str, type[PluginInterface]]:
     """
@@ -68,31 +152,68 @@ def _discover_plugins_in_package() -> dict[str, type[PluginInterface]]:
     plugin_path = plugins.__path__
 
     for _, name, ispkg in pkgutil.iter_modules(plugin_path):
-        if ispkg:  # Only consider packages
+        if not ispkg:  # Only consider packages
+            continue
+        try:
+            # Import plugin module
+            module = importlib.import_module(f"pyarm.plugins.{name}")
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Error loading plugin {name}: {e}")
+            continue
+
+        for plugin_class in _find_plugin_classes(module):
             try:
-                # Import plugin module
-                module = importlib.import_module(f"pyarm.plugins.{name}")
-
-                # Search for plugin class
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, PluginInterface)
-                        and attr is not PluginInterface
-                    ):
-                        plugin_instance = attr()
-                        discovered_plugins[plugin_instance.name] = attr
-                        logger.info(
-                            f"Plugin {plugin_instance.name} v{plugin_instance.version} found"
-                        )
-                        break
-            except (ImportError, AttributeError) as e:
-                logger.warning(f"Error loading plugin {name}: {e}")
+                plugin_name, plugin_version = _get_plugin_info(plugin_class)
+            except Exception as e:
+                logger.warning(f"Error loading plugin {plugin_class.__name__}: {e}")
+                continue
+            discovered_plugins[plugin_name] = plugin_class
+            logger.info(f"Plugin {plugin_name} v{plugin_version} found")
 
     return discovered_plugins
 
 
+def _is_plugin_class(attr: Any) -> bool:
+    return (
+        isinstance(attr, type) and issubclass(attr, PluginInterface) and attr is not PluginInterface
+    )
+
+
+def _find_plugin_classes(module: ModuleType) -> tuple[type[PluginInterface], ...]:
+    """
+    Returns all plugin classes available in a module.
+
+    A module can name its plugin class with a ``PLUGIN_CLASS`` attribute.
+    Otherwise the names in ``__all__`` are checked. Without ``__all__`` only
+    classes defined in the module or its submodules are returned, so classes
+    the module imports from other plugins are not registered twice.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The imported plugin module
+
+    Returns
+    -------
+    tuple[type[PluginInterface], ...]
+        The plugin classes of the module
+    """
+    module_attrs = vars(module)
+    plugin_class = module_attrs.get("PLUGIN_CLASS")
+    if _is_plugin_class(plugin_class):
+        return (plugin_class,)
+
+    exported = module_attrs.get("__all__")
+    if exported is not None:
+        candidates = [module_attrs.get(name) for name in exported]
+        return tuple(attr for attr in candidates if _is_plugin_class(attr))
+    return tuple(
+        attr
+        for attr in module_attrs.values()
+        if _is_plugin_class(attr) and _is_in_package(attr.__module__, module.__name__)
+    )
+
+
 def _discover_plugins_in_directory(directory: str) -> dict[str, type[PluginInterface]]:
     """
     Discovers plugins in a specific directory.
@@ -108,46 +229,125 @@ def _discover_plugins_in_directory(directory: str) -> dict[str, type[PluginInter
         Dictionary with plugin names and plugin classes
     """
     discovered_plugins = {}
-    plugin_dir = Path(directory)
+    plugin_dir = os.path.normpath(directory)
 
-    if not plugin_dir.exists() or not plugin_dir.is_dir():
+    if not os.path.isdir(plugin_dir):
         logger.warning(f"Plugin directory {directory} does not exist or is not a directory")
         return discovered_plugins
 
-    # Consider all subdirectories as potential plugins
-    for item in plugin_dir.iterdir():
-        if not item.is_dir() or not (item / "__init__.py").exists():
+    # Consider all subdirectories with an __init__.py as potential plugins
+    seen_paths = set()
+    with os.scandir(plugin_dir) as entries:
+        items = [entry for entry in entries if entry.is_dir()]
+    for item in items:
+        init_file = os.path.join(item.path, "__init__.py")
+        try:
+            init_stat = os.stat(init_file)
+        except OSError:
+            continue
+        if not stat.S_ISREG(init_stat.st_mode):
             continue
         plugin_name = item.name
+        cache_key = item.path
+        seen_paths.add(cache_key)
         try:
-            # Dynamically import the module
-            spec = importlib.util.spec_from_file_location(plugin_name, str(item / "__init__.py"))
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[plugin_name] = module
-                spec.loader.exec_module(module)
-
-                # Search for plugin class
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, PluginInterface)
-                        and attr is not PluginInterface
-                    ):
-                        plugin_instance = attr()
-                        discovered_plugins[plugin_instance.name] = attr
-                        logger.info(
-                            f"Plugin {plugin_instance.name} v{plugin_instance.version} "
-                            f"loaded from {directory}"
-                        )
-                        break
+            mtime_ns = init_stat.st_mtime_ns
+            cached = _PLUGIN_MODULE_CACHE.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                plugin_classes = cached[1]
+            else:
+                plugin_classes = _load_plugin_classes(plugin_name, init_file)
+                _PLUGIN_MODULE_CACHE[cache_key] = (mtime_ns, plugin_classes)
         except Exception as e:
             logger.warning(f"Error loading plugin {plugin_name} from {directory}: {e}")
+            continue
+
+        for plugin_class in plugin_classes:
+            try:
+                name, version = _get_plugin_info(plugin_class)
+            except Exception as e:
+                logger.warning(f"Error loading plugin {plugin_name} from {directory}: {e}")
+                continue
+            discovered_plugins[name] = plugin_class
+            logger.info(f"Plugin {name} v{version} loaded from {directory}")
+
+    # Forget plugin directories that no longer exist
+    removed_paths = [
+        path
+        for path in _PLUGIN_MODULE_CACHE
+        if os.path.dirname(path) == plugin_dir and path not in seen_paths
+    ]
+    for path in removed_paths:
+        del _PLUGIN_MODULE_CACHE[path]
 
     return discovered_plugins
 
 
+def _load_plugin_classes(module_name: str, init_file: str) -> tuple[type[PluginInterface], ...]:
+    """
+    Imports a plugin package from its __init__.py and returns its plugin classes.
+
+    Parameters
+    ----------
+    module_name: str
+        Name under which the module is registered
+    init_file: str
+        Path to the __init__.py of the plugin package
+
+    Returns
+    -------
+    tuple[type[PluginInterface], ...]
+        The plugin classes of the package
+    """
+    spec = importlib.util.spec_from_file_location(module_name, init_file)
+    if not spec or not spec.loader:
+        return ()
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    known_classes = set(_plugin_subclasses())
+    spec.loader.exec_module(module)
+
+    plugin_class = vars(module).get("PLUGIN_CLASS")
+    if _is_plugin_class(plugin_class):
+        return (plugin_class,)
+
+    # Classes defined by the plugin package itself during the import, ignoring
+    # abstract base classes and classes of other modules the plugin imports
+    new_classes = tuple(
+        subclass
+        for subclass in _plugin_subclasses()
+        if subclass not in known_classes
+        and not inspect.isabstract(subclass)
+        and _is_in_package(subclass.__module__, module_name)
+    )
+    return new_classes or _find_plugin_classes(module)
+
+
+def _is_in_package(module_name: str, package_name: str) -> bool:
+    """Checks whether a module is the package itself or one of its submodules."""
+    return module_name == package_name or module_name.startswith(f"{package_name}.")
+
+
+def _plugin_subclasses() -> list[type[PluginInterface]]:
+    """
+    Returns all direct and indirect subclasses of PluginInterface.
+
+    Returns
+    -------
+    list[type[PluginInterface]]
+        The subclasses in definition order
+    """
+    subclasses = []
+    pending = list(PluginInterface.__subclasses__())
+    while pending:
+        subclass = pending.pop(0)
+        if subclass in subclasses:
+            continue
+        subclasses.append(subclass)
+        pending.extend(subclass.__subclasses__())
+    return subclasses
+
+
 def _discover_installed_plugins() -> dict[str, type[PluginInterface]]:
     """
     Discovers plugins installed via entry_points.
@@ -157,29 +357,15 @@ def _discover_installed_plugins() -> dict[str, type[PluginInterface]]:
     """
     discovered_plugins = {}
 
-    try:
-        import importlib.metadata
-
-        for entry_point in importlib.metadata.entry_points(group="pyarm.plugins"):
-            try:
-                plugin_class = entry_point.load()
-                if (
-                    issubclass(plugin_class, PluginInterface)
-                    and plugin_class is not PluginInterface
-                ):
-                    plugin_instance = plugin_class()
-                    discovered_plugins[plugin_instance.name] = plugin_class
-                    logger.info(
-                        f"Installiertes Plugin {plugin_instance.name} v{plugin_instance.version} geladen"
-                    )
-            except (ImportError, AttributeError) as e:
-                logger.warning(
-                    f"Fehler beim Laden des installierten Plugins {entry_point.name}: {e}"
-                )
-    except ImportError:
-        logger.warning(
-            "importlib.metadata nicht verfügbar, kann keine installierten Plugins erkennen"
-        )
+    for entry_point in _all_entry_points().select(group=_ENTRY_POINT_GROUP):
+        try:
+            plugin_class = entry_point.load()
+            if issubclass(plugin_class, PluginInterface) and plugin_class is not PluginInterface:
+                name, version = _get_plugin_info(plugin_class)
+                discovered_plugins[name] = plugin_class
+                logger.info(f"Installiertes Plugin {name} v{version} geladen")
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Fehler beim Laden des installierten Plugins {entry_point.name}: {e}")
 
     return discovered_plugins
 
@@ -192,10 +378,11 @@ def get_plugin_settings(plugin_name: str) -> dict[str, Any]:
         plugin_name: Name of the plugin
 
     Returns:
-        Dictionary with plugin settings
+        Dictionary with plugin settings, a copy the plugin may modify without
+        changing the cached configuration
     """
     config = _get_plugin_config()
-    return config.get("plugin_settings", {}).get(plugin_name, {})
+    return copy.deepcopy(config.get("plugin_settings", {}).get(plugin_name, {}))
 
 
 def _get_custom_plugin_paths() -> list[str]:
@@ -207,6 +394,8 @@ def _get_custom_plugin_paths() -> list[str]:
         List of directory paths
     """
     paths = []
+    # Verzeichnisprüfungen dieses Durchlaufs
+    checked: dict[str, bool] = {}
 
     # Umgebungsvariable für Plugin-Pfade
     env_paths = os.environ.get("PYARM_PLUGIN_PATHS", "")
@@ -214,7 +403,7 @@ def _get_custom_plugin_paths() -> list[str]:
         paths.extend(env_paths.split(os.pathsep))
 
     # Konfigurationsdatei lesen
-    config_paths = _get_config_plugin_paths()
+    config_paths = _get_config_plugin_paths(checked)
     if config_paths:
         paths.extend(config_paths)
 
@@ -227,19 +416,25 @@ def _get_custom_plugin_paths() -> list[str]:
 
         # Pfade nur hinzufügen, wenn sie existieren
         for path in dev_paths:
-            if os.path.exists(path) and os.path.isdir(path):
+            if _valid_dir(path, checked):
                 paths.append(path)
 
-    return paths
+    # Doppelte Pfade entfernen, Reihenfolge beibehalten
+    return list(dict.fromkeys(paths))
 
 
-def _get_config_plugin_paths() -> list[str]:
+def _get_config_plugin_paths(checked: dict[str, bool] | None = None) -> list[str]:
     """
     Reads plugin paths from the configuration file.
 
+    Args:
+        checked: Directory checks already done in this discovery run
+
     Returns:
         List of plugin paths
     """
+    if checked is None:
+        checked = {}
     config = _get_plugin_config()
 
     paths = []
@@ -248,14 +443,14 @@ def _get_config_plugin_paths() -> list[str]:
     for entry in config.get("plugin_paths", []):
         if entry.get("enabled", True):
             path = os.path.abspath(os.path.join(os.getcwd(), entry["path"]))
-            if os.path.exists(path) and os.path.isdir(path):
+            if _valid_dir(path, checked):
                 paths.append(path)
 
     # Externe Plugin-Pfade
     for entry in config.get("external_plugin_paths", []):
         if entry.get("enabled", True):
             path = os.path.abspath(entry["path"])
-            if os.path.exists(path) and os.path.isdir(path):
+            if _valid_dir(path, checked):
                 paths.append(path)
 
     return paths
@@ -276,6 +471,10 @@ def _get_plugin_config() -> dict[str, Any]:
     """
     Reads the plugin configuration file.
 
+    The parsed file is cached and only read again once its modification
+    time changes. The returned dictionary is the cached one and must not be
+    modified; get_plugin_settings hands out copies.
+
     Returns:
         Plugin configuration as a dictionary
     """
@@ -291,12 +490,18 @@ def _get_plugin_config() -> dict[str, Any]:
 
     # Suche nach der ersten verfügbaren Konfigurationsdatei
     for config_file in config_files:
-        if not os.path.exists(config_file):
+        try:
+            mtime_ns = os.stat(config_file).st_mtime_ns
+        except OSError:
             continue
+        cached = _CONFIG_CACHE.get(config_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
         try:
             with open(config_file, "r") as f:
                 config = json.load(f)
             logger.info(f"Plugin-Konfiguration aus {config_file} geladen")
+            _CONFIG_CACHE[config_file] = (mtime_ns, config)
             return config
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Fehler beim Lesen der Plugin-Konfiguration aus {config_file}: {e}")
@@ -4,9 +4,14 @@ JSON-based repository for infrastructure elements.
 
 import json
 import os
-from datetime import datetime
+import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
+from enum import Enum
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from uuid import UUID
 
 from pyarm.models.base_models import InfrastructureElement
@@ -14,13 +19,102 @@ from pyarm.models.process_enums import ElementType
 from pyarm.repository.elements import IElementRepository
 from pyarm.utils import factory
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parses JSON data, using orjson if it is installed.
+
+    orjson rejects the NaN and Infinity literals written by the json module
+    and integers above 64 bit. Such files are parsed with the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json_default(value: Any) -> Any:
+    """Converts the values orjson serializes natively for the json module."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serializes data to compact or indented JSON, using orjson if it is installed.
+
+    Both backends write the same bytes: non-ASCII characters unescaped, UUID,
+    Enum and date values as strings and non-string keys converted to strings.
+    Only non-finite floats differ, orjson writes them as null and the json
+    module as NaN or Infinity. Parameter.to_dict already writes NaN as null.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    return text.encode("utf-8")
+
+
+def _to_uuid(uuid: Union[UUID, str]) -> UUID | None:
+    """Returns the UUID of a UUID or string, or None if the string is no valid UUID."""
+    if isinstance(uuid, UUID):
+        return uuid
+    try:
+        return UUID(str(uuid))
+    except ValueError:
+        return None
+
+
+# Maximum number of threads used for concurrent file operations
+_IO_WORKERS = 8
+
+
+def _read_elements_data(file_path: Path) -> list[dict[str, Any]]:
+    """
+    Reads and parses the element data of a JSON file.
+
+    Parameters
+    ----------
+    file_path: Path
+        Path of the JSON file
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Raw element data contained in the file
+    """
+    with open(file_path, "rb") as f:
+        elements_data = _loads(f.read())
+    if isinstance(elements_data, list):
+        return elements_data
+    if isinstance(elements_data, dict):
+        return [elements_data]
+    return []
+
 
 class JsonElementRepository(IElementRepository):
     """
     Repository for storing infrastructure elements in JSON files.
     """
 
-    def __init__(self, repository_path: str):
+    def __init__(self, repository_path: str, pretty: bool = False):
         """
         Initializes the repository.
 
@@ -28,13 +122,22 @@ class JsonElementRepository(IElementRepository):
         ----------
         repository_path: str
             Path to the repository directory
+        pretty: bool
+            Write indented JSON files for human readers instead of compact ones
         """
         self.repository_path = Path(repository_path)
+        self.pretty = pretty
         self.ensure_directory_exists()
 
         # In-memory cache for better performance
-        self._elements_cache: dict[str, InfrastructureElement] = {}
+        self._elements_cache: dict[UUID, InfrastructureElement] = {}
         self._cache_loaded = False
+        # Held only while the cache is loaded for the first time
+        self._load_lock = threading.Lock()
+        # Secondary index of the cached elements by element type
+        self._by_type: dict[ElementType, dict[UUID, InfrastructureElement]] = defaultdict(dict)
+        # Element types whose files are out of date with the cache
+        self._dirty_types: set[ElementType] = set()
 
     def ensure_directory_exists(self) -> None:
         """
@@ -45,91 +148,149 @@ class JsonElementRepository(IElementRepository):
     def _load_cache(self) -> None:
         """
         Loads all elements into the cache.
+
+        Callers check ``_cache_loaded`` before calling. The lock ensures that
+        concurrent first calls read the files only once.
         """
-        if self._cache_loaded:
-            return
+        with self._load_lock:
+            if self._cache_loaded:
+                return
+            self._read_files()
+            self._cache_loaded = True
 
+    def _read_files(self) -> None:
+        """
+        Reads all JSON files of the repository into the cache.
+        """
         self._elements_cache.clear()
+        self._by_type.clear()
 
-        # Load all JSON files in the repository directory
-        for file_path in self.repository_path.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    elements_data = json.load(f)
+        file_paths = list(self.repository_path.glob("*.json"))
+        if not file_paths:
+            return
 
-                if isinstance(elements_data, list):
-                    for element_data in elements_data:
+        # Read and parse the files concurrently, create the elements sequentially
+        with ThreadPoolExecutor(max_workers=min(_IO_WORKERS, len(file_paths))) as executor:
+            futures = [executor.submit(_read_elements_data, path) for path in file_paths]
+            for file_path, future in zip(file_paths, futures, strict=True):
+                try:
+                    for element_data in future.result():
                         element = factory.create_element(element_data)
-                        uuid_str = str(element.uuid)
-                        self._elements_cache[uuid_str] = element
-                elif isinstance(elements_data, dict):
-                    element = factory.create_element(elements_data)
-                    uuid_str = str(element.uuid)
-                    self._elements_cache[uuid_str] = element
-            except Exception as e:
-                print(f"Error loading {file_path}: {e}")
+                        self._index(element)
+                except Exception as e:
+                    print(f"Error loading {file_path}: {e}")
 
-        self._cache_loaded = True
-
-    def _save_cache(self) -> None:
+    def _flush(self) -> None:
         """
-        Saves the cache to files.
+        Writes the files of all element types changed since the last flush.
         """
-        # Group elements by type
-        elements_by_type: dict[ElementType, list[InfrastructureElement]] = {}
-        for element in self._elements_cache.values():
-            if element.element_type not in elements_by_type:
-                elements_by_type[element.element_type] = []
-            elements_by_type[element.element_type].append(element)
+        if not self._dirty_types:
+            return
 
-        # Create a file for each type
-        for element_type, elements in elements_by_type.items():
+        # Rewrite only the files of the changed types
+        for element_type in self._dirty_types:
             file_path = self.repository_path / f"{element_type.value}.json"
+            elements = self._by_type.get(element_type, {}).values()
             elements_data = [element.to_dict() for element in elements]
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(elements_data, f, indent=2)
+            self._write_file(file_path, elements_data)
+        self._dirty_types.clear()
+
+    def _write_file(self, file_path: Path, elements_data: list[dict[str, Any]]) -> None:
+        """
+        Writes element data atomically by replacing the file with a temporary file.
+
+        Parameters
+        ----------
+        file_path: Path
+            Path of the JSON file
+        elements_data: list[dict[str, Any]]
+            Serialized elements
+        """
+        # Serialize completely in memory so the file is written with one write call
+        data = _dumps(elements_data, self.pretty)
+        temp_path = file_path.with_suffix(".json.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, file_path)
+
+    def _index(self, element: InfrastructureElement) -> None:
+        """
+        Adds an element to the cache and the element type index.
+
+        Parameters
+        ----------
+        element: InfrastructureElement
+            Element to be added
+        """
+        uuid = element.uuid
+        previous = self._elements_cache.get(uuid)
+        if previous is not None:
+            self._by_type[previous.element_type].pop(uuid, None)
+        self._elements_cache[uuid] = element
+        self._by_type[element.element_type][uuid] = element
+
+    def _put(self, element: InfrastructureElement) -> None:
+        """
+        Adds an element to the cache and marks its type as changed.
+
+        Parameters
+        ----------
+        element: InfrastructureElement
+            Element to be added
+        """
+        previous = self._elements_cache.get(element.uuid)
+        if previous is not None:
+            self._dirty_types.add(previous.element_type)
+        self._index(element)
+        self._dirty_types.add(element.element_type)
 
     def get_all(self) -> list[InfrastructureElement]:
-        self._load_cache()
+        if not self._cache_loaded:
+            self._load_cache()
         return list(self._elements_cache.values())
 
     def get_by_id(self, uuid: Union[UUID, str]) -> Optional[InfrastructureElement]:
-        self._load_cache()
-        uuid_str = str(uuid)
-        return self._elements_cache.get(uuid_str)
+        if not self._cache_loaded:
+            self._load_cache()
+        key = _to_uuid(uuid)
+        if key is None:
+            return None
+        return self._elements_cache.get(key)
 
     def get_by_type(self, element_type: ElementType) -> list[InfrastructureElement]:
-        self._load_cache()
-        return [
-            element
-            for element in self._elements_cache.values()
-            if element.element_type == element_type
-        ]
+        if not self._cache_loaded:
+            self._load_cache()
+        return list(self._by_type.get(element_type, {}).values())
 
     def save(self, element: InfrastructureElement) -> None:
-        self._load_cache()
-        uuid_str = str(element.uuid)
-        self._elements_cache[uuid_str] = element
-        self._save_cache()
+        if not self._cache_loaded:
+            self._load_cache()
+        self._put(element)
+        self._flush()
 
     def save_all(self, elements: list[InfrastructureElement]) -> None:
-        self._load_cache()
+        if not self._cache_loaded:
+            self._load_cache()
         for element in elements:
-            uuid_str = str(element.uuid)
-            self._elements_cache[uuid_str] = element
-        self._save_cache()
+            self._put(element)
+        self._flush()
 
     def delete(self, uuid: Union[UUID, str]) -> None:
-        self._load_cache()
-        uuid_str = str(uuid)
-        if uuid_str in self._elements_cache:
-            del self._elements_cache[uuid_str]
-            self._save_cache()
+        if not self._cache_loaded:
+            self._load_cache()
+        key = _to_uuid(uuid)
+        if key is None:
+            return
+        element = self._elements_cache.pop(key, None)
+        if element is not None:
+            self._by_type[element.element_type].pop(key, None)
+            self._dirty_types.add(element.element_type)
+            self._flush()
 
     def clear(self) -> None:
         self._elements_cache.clear()
+        self._by_type.clear()
         self._cache_loaded = True
-        self._save_cache()
+        self._dirty_types.clear()
 
         # Delete all JSON files in the repository directory
         for file_path in self.repository_path.glob("*.json"):
@@ -148,13 +309,10 @@ class JsonElementRepository(IElementRepository):
         backup_path = self.repository_path.parent / f"backup_{timestamp}"
         os.makedirs(backup_path, exist_ok=True)
 
-        # Copy all files
-        for file_path in self.repository_path.glob("*.json"):
-            backup_file = backup_path / file_path.name
-            with (
-                open(file_path, "r", encoding="utf-8") as src,
-                open(backup_file, "w", encoding="utf-8") as dst,
-            ):
-                dst.write(src.read())
+        # Copy all files without decoding them
+        file_paths = list(self.repository_path.glob("*.json"))
+        backup_files = [backup_path / file_path.name for file_path in file_paths]
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            list(executor.map(shutil.copyfile, file_paths, backup_files))
 
         return str(backup_path)
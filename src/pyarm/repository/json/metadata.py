@@ -1,9 +1,15 @@
-from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+import operator
+from dataclasses import fields
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from pyarm.components.metadata import ProjectPhase
 from pyarm.repository.metadata import IMetadataRepository
 
+# ProjectPhase has no nested dataclasses, so its fields are serialized flat
+_PHASE_FIELDS = tuple(phase_field.name for phase_field in fields(ProjectPhase))
+_PHASE_VALUES = operator.attrgetter(*_PHASE_FIELDS)
+
 
 class MetadataRepository(IMetadataRepository):
     """
@@ -44,10 +50,10 @@ class MetadataRepository(IMetadataRepository):
             return None
         return self._custom_metadata[category].get(key)
 
-    def get_all_custom_metadata(self, category: Optional[str] = None) -> Dict[str, Any]:
+    def get_all_custom_metadata(self, category: Optional[str] = None) -> Mapping[str, Any]:
         if category is None:
-            return self._custom_metadata.copy()
-        return self._custom_metadata.get(category, {}).copy()
+            return MappingProxyType(self._custom_metadata)
+        return MappingProxyType(self._custom_metadata.get(category, {}))
 
     # Serialization methods
     def to_dict(self) -> Dict[str, Any]:
@@ -60,7 +66,10 @@ class MetadataRepository(IMetadataRepository):
             Dictionary representation of the repository
         """
         return {
-            "phases": {id: asdict(phase) for id, phase in self._project_phases.items()},
+            "phases": {
+                id: dict(zip(_PHASE_FIELDS, _PHASE_VALUES(phase), strict=True))
+                for id, phase in self._project_phases.items()
+            },
             "ifc_config": self._ifc_entity_types,
             "custom_metadata": self._custom_metadata,
         }
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, List, Mapping, Optional, Protocol
 
 from pyarm.components.metadata import ProjectPhase
 
@@ -97,10 +97,14 @@ class IMetadataRepository(Protocol):
         """
         ...
 
-    def get_all_custom_metadata(self, category: Optional[str] = None) -> Dict[str, Any]:
+    def get_all_custom_metadata(self, category: Optional[str] = None) -> Mapping[str, Any]:
         """
         Get all custom metadata in a category or all categories.
 
+        The result is a shallow read-only view; use add_custom_metadata to
+        modify it and dict(...) to get a copy. The category dicts and values
+        inside the view are the stored objects and must not be modified.
+
         Parameters
         ----------
         category : Optional[str], optional
@@ -108,7 +112,7 @@ class IMetadataRepository(Protocol):
 
         Returns
         -------
-        Dict[str, Any]
-            Dictionary of metadata
+        Mapping[str, Any]
+            Read-only mapping of metadata
         """
         ...
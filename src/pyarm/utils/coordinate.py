@@ -20,13 +20,9 @@ def calculate_line_length(params: dict[ProcessEnum, Any]) -> float | None:
 
 
 def calculate_length(point: tuple[Any, ...], other: tuple[Any, ...]) -> float | None:
-    pow_values = []
-    for pnt, oth in zip(point, other):
-        pow_values.append(abs(float(pnt) - float(oth)) ** 2)
-    if len(pow_values) != 3:
-        return None
-    pow_sum = sum(pow_values)
-    try:
-        return math.sqrt(pow_sum)
-    except ValueError:
+    if len(point) < 3 or len(other) < 3:
         return None
+    dx = float(point[0]) - float(other[0])
+    dy = float(point[1]) - float(other[1])
+    dz = float(point[2] or 0.0) - float(other[2] or 0.0)
+    return math.hypot(dx, dy, dz)
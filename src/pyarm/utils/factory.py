@@ -4,6 +4,7 @@ These factory methods are optimized to work with the new component-based design
 and ensure that elements are correctly initialized with all necessary components.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type, TypeVar
 from uuid import UUID, uuid4
 
@@ -14,6 +15,14 @@ from pyarm.components import (
     PointLocation,
 )
 from pyarm.models.base_models import InfrastructureElement
+from pyarm.models.element_models import (
+    CurvedTrack,
+    Foundation,
+    Mast,
+    SewerPipe,
+    SewerShaft,
+    Track,
+)
 from pyarm.models.parameter import Parameter
 from pyarm.models.process_enums import ElementType, ProcessEnum
 from pyarm.utils import helpers as hlp
@@ -21,6 +30,31 @@ from pyarm.utils import helpers as hlp
 # Type variable for generic elements
 T = TypeVar("T", bound=InfrastructureElement)
 
+_CLOTHOID_PROCESS = ProcessEnum.CLOTHOID_PARAMETER.value
+
+_REFERENCE_SUFFIX = "_uuid"
+
+_ELEMENT_CLASS_MAP: Dict[ElementType, Type[Any]] = {
+    ElementType.FOUNDATION: Foundation,
+    ElementType.MAST: Mast,
+    ElementType.TRACK: Track,
+    ElementType.SEWER_PIPE: SewerPipe,
+    ElementType.SEWER_SHAFT: SewerShaft,
+}
+
+
+def _as_uuid(value: Any) -> UUID:
+    """Return value as UUID, parsing it only if it is not one already."""
+    return value if type(value) is UUID else UUID(value)
+
+
+@lru_cache(maxsize=None)
+def _class_for(element_type: ElementType, has_clothoid: bool) -> Type[Any]:
+    """Return the element class for an element type and its clothoid flag."""
+    if element_type == ElementType.TRACK and has_clothoid:
+        return CurvedTrack
+    return _ELEMENT_CLASS_MAP.get(element_type, InfrastructureElement)
+
 
 def determine_element_class(data: Dict[str, Any]) -> Type[Any]:
     """
@@ -36,16 +70,6 @@ def determine_element_class(data: Dict[str, Any]) -> Type[Any]:
     Type[Any]
         Element class
     """
-    # Runtime import to avoid circular imports
-    from pyarm.models.element_models import (
-        CurvedTrack,
-        SewerPipe,
-        SewerShaft,
-        Foundation,
-        Mast,
-        Track,
-    )
-
     # Determine element type using helper function
     element_type_value = hlp.extract_value(data, "element_type")
 
@@ -56,39 +80,13 @@ def determine_element_class(data: Dict[str, Any]) -> Type[Any]:
     else:
         element_type = ElementType.UNDEFINED
 
-    # Search parameter list for special properties
-    parameters = data.get("parameters", [])
-
-    # Check if it's a curve
-    has_clothoid = any(p.get("process") == ProcessEnum.CLOTHOID_PARAMETER.value for p in parameters)
-
-    # Check for start/end coordinates for linear elements
-    has_end_coordinates = any(
-        p.get("process")
-        in [
-            ProcessEnum.X_COORDINATE_END.value,
-            ProcessEnum.Y_COORDINATE_END.value,
-            ProcessEnum.Z_COORDINATE_END.value,
-        ]
-        for p in parameters
+    # Only tracks depend on their parameters: a clothoid makes it a curve
+    has_clothoid = element_type == ElementType.TRACK and any(
+        param.get("process") == _CLOTHOID_PROCESS for param in data.get("parameters", ())
     )
 
     # Determine class based on element type and properties
-    if element_type == ElementType.FOUNDATION:
-        return Foundation
-    elif element_type == ElementType.MAST:
-        return Mast
-    elif element_type == ElementType.TRACK:
-        if has_clothoid:
-            return CurvedTrack
-        else:
-            return Track
-    elif element_type == ElementType.SEWER_PIPE:
-        return SewerPipe
-    elif element_type == ElementType.SEWER_SHAFT:
-        return SewerShaft
-    else:
-        return InfrastructureElement
+    return _class_for(element_type, has_clothoid)
 
 
 def create_element(data: dict[str, Any]) -> Any:
@@ -106,12 +104,10 @@ def create_element(data: dict[str, Any]) -> Any:
     Any
         Created element with components
     """
-    from pyarm.models.element_models import CurvedTrack, Mast, Track
-
     # Extract basic attributes using helper functions
     name = hlp.extract_value(data, "name", "Unknown", str)
     uuid_value = hlp.extract_value(data, "uuid")
-    uuid = UUID(uuid_value) if uuid_value else uuid4()
+    uuid = _as_uuid(uuid_value) if uuid_value else uuid4()
 
     # Determine element type using helper functions
     element_type_value = hlp.extract_value(data, "element_type")
@@ -123,18 +119,7 @@ def create_element(data: dict[str, Any]) -> Any:
         element_type = ElementType.UNDEFINED
 
     # Process parameters
-    parameters = []
-    for param_data in data.get("parameters", []):
-        parameters.append(hlp.create_parameter_from(param_data))
-
-    # Collect references
-    references = {}
-    for ref_key, ref_value in data.items():
-        if ref_key.endswith("_uuid") and ref_value and ref_key != "uuid":
-            if not isinstance(ref_value, UUID) and isinstance(ref_value, str):
-                ref_value = UUID(ref_value)
-            ref_type = ref_key.replace("_uuid", "")
-            references[ref_type] = ref_value
+    parameters = list(map(hlp.create_parameter_from, data.get("parameters", ())))
 
     # Determine element class
     element_class = determine_element_class(data)
@@ -147,18 +132,33 @@ def create_element(data: dict[str, Any]) -> Any:
         parameters=parameters,
     )
 
-    if isinstance(element, Mast) and "foundation" in references:
-        foundation_uuid = references["foundation"]
+    # Collect references
+    foundation_uuid = track_uuid = None
+    references = []
+    for ref_key, ref_value in data.items():
+        if not ref_value or not ref_key.endswith(_REFERENCE_SUFFIX):
+            continue
+        ref_type = ref_key[: -len(_REFERENCE_SUFFIX)]
+        if not ref_type:
+            continue
+        if isinstance(ref_value, str):
+            ref_value = UUID(ref_value)
+        if ref_type == "foundation":
+            foundation_uuid = ref_value
+        elif ref_type == "track":
+            track_uuid = ref_value
+        else:
+            references.append((ref_type, ref_value))
+
+    if foundation_uuid is not None and isinstance(element, Mast):
         element.add_reference(Mast, foundation_uuid)
 
-    if isinstance(element, (Track, CurvedTrack)) and "track" in references:
-        track_uuid = references["track"]
+    if track_uuid is not None and isinstance(element, Track):
         element.add_reference(type(element), track_uuid)
 
     # Add additional references
-    for ref_type, ref_uuid in references.items():
-        if ref_type not in ["uuid", "foundation", "track"]:
-            element.add_reference(ref_type, ref_uuid)
+    for ref_type, ref_uuid in references:
+        element.add_reference(ref_type, ref_uuid)
 
     return element
 
@@ -178,7 +178,8 @@ def create_elements(element_data_list: list[dict[str, Any]]) -> list[Any]:
     list[Any]
         List of created elements with components
     """
-    return [create_element(data) for data in element_data_list]
+    create = create_element
+    return [create(data) for data in element_data_list]
 
 
 def create_component_based_element(
@@ -216,29 +217,8 @@ def create_component_based_element(
     Any
         Created element with the specified components
     """
-    # Runtime import to avoid circular imports
-    from pyarm.models.element_models import (
-        SewerPipe,
-        SewerShaft,
-        Foundation,
-        Mast,
-        Track,
-    )
-
     # Choose element class based on type
-    element_class = None
-    if element_type == ElementType.FOUNDATION:
-        element_class = Foundation
-    elif element_type == ElementType.MAST:
-        element_class = Mast
-    elif element_type == ElementType.TRACK:
-        element_class = Track
-    elif element_type == ElementType.SEWER_PIPE:
-        element_class = SewerPipe
-    elif element_type == ElementType.SEWER_SHAFT:
-        element_class = SewerShaft
-    else:
-        element_class = InfrastructureElement
+    element_class = _ELEMENT_CLASS_MAP.get(element_type, InfrastructureElement)
 
     # Create element
     element = element_class(
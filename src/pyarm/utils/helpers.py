@@ -4,6 +4,8 @@ These functions reduce code duplication and improve maintainability.
 """
 
 import logging
+from enum import Enum
+from operator import attrgetter
 from typing import Any
 
 from pyarm.models import units
@@ -12,6 +14,39 @@ from pyarm.models.process_enums import ElementType, ProcessEnum
 
 logger = logging.getLogger(__name__)
 
+# Common variants of element type names
+_ELEMENT_TYPE_MAPPINGS: dict[str, ElementType] = {
+    "mast": ElementType.MAST,
+    "pole": ElementType.MAST,
+    "fundament": ElementType.FOUNDATION,
+    "foundation": ElementType.FOUNDATION,
+    "joch": ElementType.JOCH,
+    "yoke": ElementType.JOCH,
+    "drainage": ElementType.SEWER_SHAFT,
+    "drainagepipe": ElementType.SEWER_SHAFT,
+    "pipe": ElementType.SEWER_SHAFT,
+    "leitung": ElementType.SEWER_SHAFT,
+    "drain": ElementType.SEWER_SHAFT,
+    "shaft": ElementType.SEWER_SHAFT,
+    "schacht": ElementType.SEWER_SHAFT,
+    "drainageschacht": ElementType.SEWER_SHAFT,
+    "drainageshaft": ElementType.SEWER_SHAFT,
+    "gleis": ElementType.TRACK,
+    "track": ElementType.TRACK,
+    "rail": ElementType.TRACK,
+    "ausleger": ElementType.CANTILEVER,
+    "cantilever": ElementType.CANTILEVER,
+}
+
+# Exact lookup; the enum values take precedence over the variants
+_ELEMENT_TYPE_LOOKUP: dict[str, ElementType] = {
+    **_ELEMENT_TYPE_MAPPINGS,
+    **{element_type.value: element_type for element_type in ElementType},
+}
+
+# Fields of a Parameter that make up its entry in an element data template
+_PARAMETER_FIELDS = attrgetter("name", "value", "datatype", "unit", "process")
+
 
 def create_parameter_from(param_data: dict[str, Any]) -> "Parameter":
     """
@@ -29,18 +64,12 @@ def create_parameter_from(param_data: dict[str, Any]) -> "Parameter":
         Parameter object
     """
     name = extract_value(param_data, "name", "", str)
-    value = extract_value(param_data, "value")
-    datatype = extract_value(param_data, "datatype", expected_type=DataType)
-    unit = extract_value(param_data, "unit", default=UnitEnum.NONE, expected_type=UnitEnum)
-    process = extract_value(param_data, "process", default=None, expected_type=ProcessEnum)
+    value = _extract_raw(param_data, "value")
+    datatype = _extract_enum(param_data, "datatype", DataType)
+    unit = _extract_enum(param_data, "unit", UnitEnum, UnitEnum.NONE)
+    process = _extract_enum(param_data, "process", ProcessEnum)
 
-    return Parameter(
-        name=name,
-        value=value,
-        process=process,
-        datatype=datatype,
-        unit=unit,
-    )
+    return Parameter(name, value, datatype, process, unit)
 
 
 def resolve_element_type(type_str: str) -> ElementType:
@@ -57,44 +86,22 @@ def resolve_element_type(type_str: str) -> ElementType:
     ElementType
         The corresponding ElementType enum or ElementType.NONE if not found
     """
+    # Already normalized strings (e.g. enum values from JSON) need no further work
+    element_type = _ELEMENT_TYPE_LOOKUP.get(type_str)
+    if element_type is not None:
+        return element_type
+
     # Normalize and map common variants
     normalized = type_str.lower().strip()
 
-    mappings = {
-        "mast": ElementType.MAST,
-        "pole": ElementType.MAST,
-        "fundament": ElementType.FOUNDATION,
-        "foundation": ElementType.FOUNDATION,
-        "joch": ElementType.JOCH,
-        "yoke": ElementType.JOCH,
-        "drainage": ElementType.SEWER_SHAFT,
-        "drainagepipe": ElementType.SEWER_SHAFT,
-        "pipe": ElementType.SEWER_SHAFT,
-        "leitung": ElementType.SEWER_SHAFT,
-        "drain": ElementType.SEWER_SHAFT,
-        "shaft": ElementType.SEWER_SHAFT,
-        "schacht": ElementType.SEWER_SHAFT,
-        "drainageschacht": ElementType.SEWER_SHAFT,
-        "drainageshaft": ElementType.SEWER_SHAFT,
-        "gleis": ElementType.TRACK,
-        "track": ElementType.TRACK,
-        "rail": ElementType.TRACK,
-        "ausleger": ElementType.CANTILEVER,
-        "cantilever": ElementType.CANTILEVER,
-    }
-
-    # Direct comparison with enum values
-    try:
-        return ElementType(normalized)
-    except ValueError:
-        # Use mapping
-        if normalized in mappings:
-            return mappings[normalized]
+    element_type = _ELEMENT_TYPE_LOOKUP.get(normalized)
+    if element_type is not None:
+        return element_type
 
-        # Partial comparison
-        for key, element_type in mappings.items():
-            if key in normalized or normalized in key:
-                return element_type
+    # Partial comparison
+    for key, element_type in _ELEMENT_TYPE_MAPPINGS.items():
+        if key in normalized or normalized in key:
+            return element_type
 
     # Fallback if no match
     logger.warning(f"Could not resolve ElementType for '{type_str}', using {ElementType.UNDEFINED}")
@@ -202,6 +209,35 @@ def extract_value(
     return value
 
 
+def _extract_raw(data: dict[str, Any], key: str, default: Any = None) -> Any:
+    """Shortcut of ``extract_value`` without type or unit conversion."""
+    value = data.get(key, default)
+    return default if value is None else value
+
+
+def _extract_enum(data: dict[str, Any], key: str, enum_cls: type[Enum], default: Any = None) -> Any:
+    """Shortcut of ``extract_value`` with an enum as expected type."""
+    value = data.get(key, default)
+    if value is None:
+        return default
+    return _coerce_enum(value, enum_cls, default)
+
+
+def _coerce_enum(value: Any, enum_cls: type[Enum], default: Any = None) -> Any:
+    """Convert value to enum_cls, unless it already is a member of it."""
+    if isinstance(value, enum_cls):
+        return value
+    try:
+        # Known values resolve through the value map without the Enum constructor
+        member = enum_cls._value2member_map_.get(value)
+        if member is not None:
+            return member
+        return enum_cls(value)
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Could not convert value '{value}' to type '{enum_cls}': {e}")
+        return default
+
+
 def create_element_data_template(
     name: str, element_type: ElementType, parameters: list[Parameter] | None = None
 ) -> dict[str, Any]:
@@ -222,19 +258,19 @@ def create_element_data_template(
     dict[str, Any]
         Dictionary with base element data
     """
+    param_data = []
+    for param_name, value, datatype, unit, process in map(_PARAMETER_FIELDS, parameters or ()):
+        param_data.append(
+            {
+                "name": param_name,
+                "value": value,
+                "datatype": datatype,
+                "unit": unit.value,
+                "process": process.value if process else None,
+            }
+        )
     return {
         "name": name,
         "element_type": element_type.value,
-        "parameters": []
-        if parameters is None
-        else [
-            {
-                "name": param.name,
-                "value": param.value,
-                "datatype": param.datatype,
-                "unit": param.unit.value,
-                "process": param.process.value if param.process else None,
-            }
-            for param in parameters
-        ],
+        "parameters": param_data,
     }
@@ -2,6 +2,8 @@
 TypeGuard functions for type checking and refinement.
 """
 
+from functools import lru_cache
+from itertools import repeat
 from typing import Any, TypeGuard, TypeVar
 
 from pyarm.interfaces.protocols import HasClothoid
@@ -41,6 +43,34 @@ def is_infrastructure_element(obj: Any) -> TypeGuard[InfrastructureElement]:
     return isinstance(obj, InfrastructureElement)
 
 
+def is_kind(
+    obj: Any, element_type: ElementType, element_class: type[ElementT] | None = None
+) -> TypeGuard[ElementT]:
+    """
+    Checks if an object is an InfrastructureElement of a specific element type.
+
+    Parameters
+    ----------
+    obj: Any
+        Object to check
+    element_type: ElementType
+        Element type to check for
+    element_class: type[ElementT] | None
+        Element class that matches regardless of the element type (optional)
+
+    Returns
+    -------
+    TypeGuard[ElementT]
+        True if the object has the element type or is an instance of the element class
+    """
+    if not isinstance(obj, InfrastructureElement):
+        return False
+    # Compare by equality, element_type may also be a plain string value
+    if obj.element_type == element_type:
+        return True
+    return element_class is not None and isinstance(obj, element_class)
+
+
 def is_foundation(obj: Any) -> TypeGuard[Foundation]:
     """
     Checks if an object is a Foundation.
@@ -55,9 +85,7 @@ def is_foundation(obj: Any) -> TypeGuard[Foundation]:
     TypeGuard[Foundation]
         True if the object is a Foundation
     """
-    return isinstance(obj, Foundation) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.FOUNDATION
-    )
+    return is_kind(obj, ElementType.FOUNDATION, Foundation)
 
 
 def is_mast(obj: Any) -> TypeGuard[Mast]:
@@ -74,9 +102,7 @@ def is_mast(obj: Any) -> TypeGuard[Mast]:
     TypeGuard[Mast]
         True if the object is a Mast
     """
-    return isinstance(obj, Mast) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.MAST
-    )
+    return is_kind(obj, ElementType.MAST, Mast)
 
 
 def is_cantilever(obj: Any) -> TypeGuard[Cantilever]:
@@ -93,9 +119,7 @@ def is_cantilever(obj: Any) -> TypeGuard[Cantilever]:
     TypeGuard[Cantilever]
         True if the object is a Cantilever
     """
-    return isinstance(obj, Cantilever) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.CANTILEVER
-    )
+    return is_kind(obj, ElementType.CANTILEVER, Cantilever)
 
 
 def is_joch(obj: Any) -> TypeGuard[Joch]:
@@ -112,9 +136,7 @@ def is_joch(obj: Any) -> TypeGuard[Joch]:
     TypeGuard[Joch]
         True if the object is a Joch
     """
-    return isinstance(obj, Joch) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.JOCH
-    )
+    return is_kind(obj, ElementType.JOCH, Joch)
 
 
 def is_track(obj: Any) -> TypeGuard[Track]:
@@ -131,9 +153,7 @@ def is_track(obj: Any) -> TypeGuard[Track]:
     TypeGuard[Track]
         True if the object is a Track
     """
-    return isinstance(obj, Track) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.TRACK
-    )
+    return is_kind(obj, ElementType.TRACK, Track)
 
 
 def is_curved_track(obj: Any) -> TypeGuard[CurvedTrack]:
@@ -167,9 +187,7 @@ def is_sleeper(obj: Any) -> TypeGuard[Sleeper]:
     TypeGuard[Sleeper]
         True if the object is a Sleeper
     """
-    return isinstance(obj, Sleeper) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.SLEEPER
-    )
+    return is_kind(obj, ElementType.SLEEPER, Sleeper)
 
 
 def is_drainage_pipe(obj: Any) -> TypeGuard[SewerPipe]:
@@ -186,9 +204,7 @@ def is_drainage_pipe(obj: Any) -> TypeGuard[SewerPipe]:
     TypeGuard[DrainagePipe]
         True if the object is a DrainagePipe
     """
-    return isinstance(obj, SewerPipe) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.SEWER_SHAFT
-    )
+    return is_kind(obj, ElementType.SEWER_SHAFT, SewerPipe)
 
 
 def is_drainage_shaft(obj: Any) -> TypeGuard[SewerShaft]:
@@ -205,14 +221,14 @@ def is_drainage_shaft(obj: Any) -> TypeGuard[SewerShaft]:
     TypeGuard[DrainageShaft]
         True if the object is a DrainageShaft
     """
-    return isinstance(obj, SewerShaft) or (
-        isinstance(obj, InfrastructureElement) and obj.element_type == ElementType.SEWER_SHAFT
-    )
+    return is_kind(obj, ElementType.SEWER_SHAFT, SewerShaft)
 
 
 def has_clothoid_capability(obj: Any) -> TypeGuard[HasClothoid]:
     """
     Checks if an object implements the Clothoid interface.
+    The clothoid properties must be defined on the class of the object;
+    the result is cached per class.
 
     Parameters
     ----------
@@ -224,10 +240,16 @@ def has_clothoid_capability(obj: Any) -> TypeGuard[HasClothoid]:
     TypeGuard[HasClothoid]
         True if the object implements the Clothoid interface
     """
+    return _has_clothoid_members(type(obj))
+
+
+@lru_cache(maxsize=None)
+def _has_clothoid_members(cls: type) -> bool:
+    """Checks once per class if it defines the properties of HasClothoid."""
     return (
-        hasattr(obj, "clothoid_parameter")
-        and hasattr(obj, "start_radius")
-        and hasattr(obj, "end_radius")
+        hasattr(cls, "clothoid_parameter")
+        and hasattr(cls, "start_radius")
+        and hasattr(cls, "end_radius")
     )
 
 
@@ -247,7 +269,7 @@ def is_list_of_type(items: list[Any], element_type: type[T]) -> TypeGuard[list[T
     TypeGuard[list[T]]
         True if the list contains only elements of the specified type
     """
-    return all(isinstance(item, element_type) for item in items)
+    return all(map(isinstance, items, repeat(element_type)))
 
 
 def is_dict_of_type(items: dict[str, Any], element_type: type[T]) -> TypeGuard[dict[str, T]]:
@@ -266,7 +288,7 @@ def is_dict_of_type(items: dict[str, Any], element_type: type[T]) -> TypeGuard[d
     TypeGuard[dict[str, T]]
         True if the dictionary contains only values of the specified type
     """
-    return all(isinstance(item, element_type) for item in items.values())
+    return all(map(isinstance, items.values(), repeat(element_type)))
 
 
 def ensure_type(obj: Any, expected_type: type[T]) -> T:
@@ -2,10 +2,16 @@
 
 
 import logging
-from typing import Any, TypeGuard
+from functools import lru_cache
+from typing import Any, Iterable, TypeGuard
 
 log = logging.getLogger(__name__)
 
+# Bit flags returned by common_flag
+INT_FLAG = 1
+FLOAT_FLAG = 2
+BOOL_FLAG = 4
+
 
 def is_int(value: Any) -> TypeGuard[int]:
     """
@@ -21,13 +27,23 @@ def is_int(value: Any) -> TypeGuard[int]:
     bool
         True if the value is an integer, False otherwise
     """
-    if value is None:
+    if value is None or isinstance(value, bool):
         return False
     if isinstance(value, int):
         return True
     if not isinstance(value, str):
         value = str(value)
-    if isinstance(value, str):
+    return _is_int_str(value)
+
+
+@lru_cache(maxsize=4096)
+def _is_int_str(value: str) -> bool:
+    """Integer check of a string, cached for the repeated values of columns."""
+    # Plain digit strings (optionally signed) need no conversion attempt
+    digits = value[1:] if value[:1] in ("+", "-") else value
+    if digits.isascii() and digits.isdigit():
+        return True
+    if "," in value or ".0" in value:
         value = value.replace(",", ".").replace(".0", "")
     try:
         int(value)
@@ -50,13 +66,19 @@ def is_float(value: Any) -> TypeGuard[float]:
     bool
         True if the value is a float, False otherwise
     """
-    if value is None:
+    if value is None or isinstance(value, bool):
         return False
-    if isinstance(value, float):
+    if isinstance(value, (float, int)):
         return True
     if not isinstance(value, str):
         value = str(value)
-    if isinstance(value, str):
+    return _is_float_str(value)
+
+
+@lru_cache(maxsize=4096)
+def _is_float_str(value: str) -> bool:
+    """Float check of a string, cached for the repeated values of columns."""
+    if "," in value:
         value = value.replace(",", ".")
     try:
         float(value)
@@ -68,6 +90,12 @@ def is_float(value: Any) -> TypeGuard[float]:
 TRUE_VALUES = {"true", "1", "yes", "ja", "y", "on"}
 FALSE_VALUES = {"false", "0", "no", "nein", "n", "off"}
 
+# Boolean value of every known (lowercase) boolean string
+_BOOL_MAP: dict[str, bool] = {
+    **dict.fromkeys(FALSE_VALUES, False),
+    **dict.fromkeys(TRUE_VALUES, True),
+}
+
 
 def is_bool(value: Any) -> bool:
     """
@@ -89,7 +117,7 @@ def is_bool(value: Any) -> bool:
         return True
     if not isinstance(value, str):
         value = str(value)
-    return value.lower() in TRUE_VALUES or value.lower() in FALSE_VALUES
+    return value.lower() in _BOOL_MAP
 
 
 def as_bool(value: Any) -> bool:
@@ -112,4 +140,35 @@ def as_bool(value: Any) -> bool:
         return value
     if not isinstance(value, str):
         value = str(value)
-    return value.lower() in TRUE_VALUES
+    return _BOOL_MAP.get(value.lower(), False)
+
+
+ALL_FLAGS = INT_FLAG | FLOAT_FLAG | BOOL_FLAG
+
+
+def common_flag(values: Iterable[Any], flags: int = ALL_FLAGS) -> int:
+    """
+    Find the first type all values can be interpreted as, e.g. for a whole column.
+
+    The types are checked in the order INT_FLAG, FLOAT_FLAG, BOOL_FLAG. Each
+    check stops at the first value that fails it, so a column that fits the
+    first type is never checked for the others. Repeated strings are served
+    from the caches of the single value checks.
+
+    Parameters
+    ----------
+    values: Iterable[Any]
+        The values to be classified
+    flags: int
+        The flags to check, all by default
+
+    Returns
+    -------
+    int
+        The first flag that holds for every value, 0 if none does
+    """
+    values = list(values)
+    for flag, check in ((INT_FLAG, is_int), (FLOAT_FLAG, is_float), (BOOL_FLAG, is_bool)):
+        if flags & flag and all(check(value) for value in values):
+            return flag
+    return 0
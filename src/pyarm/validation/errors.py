@@ -5,20 +5,26 @@ This module defines various error types that can occur during validation
 as well as a class for storing validation results.
 """
 
+import sys
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional
 
 
-class ErrorSeverity(Enum):
-    """Severity level of a validation error."""
+class ErrorSeverity(IntEnum):
+    """Severity level of a validation error, lower values are more severe."""
 
-    CRITICAL = auto()  # Critical error that prevents conversion
-    ERROR = auto()  # Severe error that may lead to data loss
-    WARNING = auto()  # Warning, conversion can continue
+    CRITICAL = 1  # Critical error that prevents conversion
+    ERROR = 2  # Severe error that may lead to data loss
+    WARNING = 3  # Warning, conversion can continue
 
 
-@dataclass
+# Severities that make a validation result invalid
+_INVALIDATING_SEVERITIES = frozenset({ErrorSeverity.CRITICAL, ErrorSeverity.ERROR})
+
+
+@dataclass(slots=True, eq=False)
 class ValidationError:
     """Represents a validation error with context information."""
 
@@ -29,28 +35,34 @@ class ValidationError:
     element_id: Optional[str] = None
     parameter_name: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """Interns the recurring type and parameter names shared by many errors."""
+        if type(self.element_type) is str:
+            self.element_type = sys.intern(self.element_type)
+        if type(self.parameter_name) is str:
+            self.parameter_name = sys.intern(self.parameter_name)
+
     def __str__(self) -> str:
         """Returns a formatted error message."""
-        context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
-        element_info = ""
+        parts = [self.severity.name, ": ", self.message, " "]
         if self.element_type:
-            element_info += f"[Type: {self.element_type}]"
+            parts += ("[Type: ", self.element_type, "]")
         if self.element_id:
-            element_info += f"[ID: {self.element_id}]"
+            parts += ("[ID: ", self.element_id, "]")
         if self.parameter_name:
-            element_info += f"[Parameter: {self.parameter_name}]"
+            parts += ("[Parameter: ", self.parameter_name, "]")
+        parts += (" {", ", ".join([f"{k}={v}" for k, v in self.context.items()]), "}")
+        return "".join(parts)
 
-        return f"{self.severity.name}: {self.message} {element_info} {{{context_str}}}"
 
-
-@dataclass
+@dataclass(slots=True, eq=False)
 class ValidationWarning(ValidationError):
     """Represents a validation warning."""
 
     severity: ErrorSeverity = ErrorSeverity.WARNING
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ValidationResult:
     """Contains the result of a validation with errors and warnings."""
 
@@ -62,9 +74,13 @@ class ValidationResult:
         """Adds an error and sets is_valid to False
         if it is a critical error."""
         self.errors.append(error)
-        if error.severity in [ErrorSeverity.CRITICAL, ErrorSeverity.ERROR]:
+        if error.severity in _INVALIDATING_SEVERITIES:
             self.is_valid = False
 
+    def has_errors(self, min_severity: ErrorSeverity = ErrorSeverity.ERROR) -> bool:
+        """Checks if an error is at least as severe as min_severity."""
+        return any(error.severity <= min_severity for error in self.errors)
+
     def add_warning(self, warning: ValidationWarning) -> None:
         """Adds a warning."""
         self.warnings.append(warning)
@@ -75,15 +91,21 @@ class ValidationResult:
         self.errors.extend(other.errors)
         self.warnings.extend(other.warnings)
 
+    def merge_many(self, others: Iterable["ValidationResult"]) -> None:
+        """Merges several validation results in one pass, in the given order."""
+        others = list(others)
+        self.is_valid = self.is_valid and all(other.is_valid for other in others)
+        self.errors.extend(chain.from_iterable(other.errors for other in others))
+        self.warnings.extend(chain.from_iterable(other.warnings for other in others))
+
     def __str__(self) -> str:
         """Returns a summary of the validation result."""
-        result = f"Validation {'successful' if self.is_valid else 'failed'}\n"
+        lines = [f"Validation {'successful' if self.is_valid else 'failed'}"]
         if self.errors:
-            result += f"Errors ({len(self.errors)}):\n"
-            for error in self.errors:
-                result += f"  - {error}\n"
+            lines.append(f"Errors ({len(self.errors)}):")
+            lines.extend([f"  - {error}" for error in self.errors])
         if self.warnings:
-            result += f"Warnings ({len(self.warnings)}):\n"
-            for warning in self.warnings:
-                result += f"  - {warning}\n"
-        return result
+            lines.append(f"Warnings ({len(self.warnings)}):")
+            lines.extend([f"  - {warning}" for warning in self.warnings])
+        lines.append("")
+        return "\n".join(lines)
@@ -8,7 +8,16 @@ Validierungssystems.
 
 import logging
 import math
-from typing import Any, Dict, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
 from pyarm.models.parameter import DataType, UnitEnum
 from pyarm.models.process_enums import ElementType, ProcessEnum
@@ -21,11 +30,345 @@ from pyarm.validation.validators import ElementValidator
 log = logging.getLogger(__name__)
 
 
+# Meldung und Kontext einer Warnung, unabhängig vom konkreten Element
+_Finding = Tuple[str, Dict[str, Any]]
+
+# Plausibilitätsprüfung über mehrere Parameter: benötigte Parameter, Bedingung für
+# eine Auffälligkeit und Befund, beide mit den Parameterwerten in dieser Reihenfolge
+_CrossCheck = Tuple[Tuple[str, ...], Callable[..., bool], Callable[..., _Finding]]
+
+# Meldungsvorlagen der Plausibilitätsprüfungen, einmal pro Modul angelegt
+_MSG_VOLUME_SMALL = "Foundation-Volumen ist sehr klein: {:.2f}m³"
+_MSG_VOLUME_LARGE = "Foundation-Volumen ist sehr groß: {:.2f}m³"
+_MSG_RATIO = "Ungewöhnliches Höhe-zu-Breite-Verhältnis: {:.2f}"
+_MSG_WOOD_MAST_HIGH = "Holzmast mit ungewöhnlicher Höhe: {}m (üblich bis 15m)"
+_MSG_STEEL_MAST_LOW = "Stahlmast mit ungewöhnlich geringer Höhe: {}m (üblich ab 5m)"
+_MSG_TRACK_SHORT = "Gleislänge ist sehr kurz: {:.2f}m"
+_MSG_TRACK_STEEP = "Gleissteigung ist sehr steil: {:.2f}%"
+_MSG_TRACK_GAUGE = "Hauptgleis mit ungewöhnlicher Spurweite: {}m (Normalspur: 1.435m)"
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Wandelt einen Parameterwert in float um, None bleibt None."""
+    # Bereits korrekt typisierte Werte (der Normalfall) ohne Konvertierung durchreichen
+    if type(value) is float or value is None:
+        return value
+    return float(value)
+
+
+def _add_findings(
+    result: ValidationResult,
+    findings: Tuple[_Finding, ...],
+    element_type: ElementType,
+    element_id: Optional[str],
+) -> None:
+    """Fügt zwischengespeicherte Befunde als Warnungen des Elements hinzu."""
+    type_value = element_type.value
+    for message, context in findings:
+        result.add_warning(
+            ValidationWarning(
+                message=message,
+                context=dict(context),
+                element_type=type_value,
+                element_id=element_id,
+            )
+        )
+
+
+def _run_cross_checks(
+    checks: Tuple[_CrossCheck, ...], values: Mapping[str, Any]
+) -> Tuple[_Finding, ...]:
+    """
+    Wertet Plausibilitätsprüfungen über mehrere Parameter aus.
+
+    Prüfungen, für die einer der benötigten Werte fehlt, werden übersprungen.
+
+    Parameters
+    ----------
+    checks : Tuple[_CrossCheck, ...]
+        Die auszuwertenden Prüfungen
+    values : Mapping[str, Any]
+        Die Parameterwerte nach Name
+
+    Returns
+    -------
+    Tuple[_Finding, ...]
+        Meldung und Kontext der gefundenen Auffälligkeiten, in Reihenfolge der Prüfungen
+    """
+    findings = []
+    for names, is_conspicuous, finding in checks:
+        args = [values[name] for name in names]
+        if None not in args and is_conspicuous(*args):
+            findings.append(finding(*args))
+    return tuple(findings)
+
+
+def _volume_finding(template: str, width: float, height: float, depth: float) -> _Finding:
+    """Befund zum Volumen eines Fundaments mit der Meldungsvorlage template."""
+    volume = width * height * depth
+    context = {"width": width, "height": height, "depth": depth, "volume": volume}
+    return template.format(volume), context
+
+
+def _height_ratio(width: float, height: float) -> float:
+    """Höhe-zu-Breite-Verhältnis eines Fundaments, unendlich ohne Breite."""
+    return height / width if width > 0 else float("inf")
+
+
+def _is_track_short(horizontal_sq: float, dz: float) -> bool:
+    """Prüft, ob ein Gleis kürzer als 1m ist."""
+    return horizontal_sq + dz * dz < 1.0
+
+
+def _track_short_finding(
+    horizontal_sq: float, dz: float, start: Tuple[float, ...], end: Tuple[float, ...]
+) -> _Finding:
+    """Befund zu einem zu kurzen Gleis."""
+    length = math.sqrt(horizontal_sq + dz * dz)
+    return _MSG_TRACK_SHORT.format(length), {"length": length, "start": start, "end": end}
+
+
+def _is_track_steep(dx: float, dy: float, dz: float, horizontal_sq: float) -> bool:
+    """Prüft, ob die Steigung eines Gleises 4% übersteigt."""
+    # Vermeiden einer Division durch 0
+    if abs(dx) <= 0.001 and abs(dy) <= 0.001:
+        return False
+    # Zu steiles Gefälle? |dz| / horizontal > 4% <=> dz² * 625 > horizontal²
+    return dz * dz * 625.0 > horizontal_sq
+
+
+def _track_steep_finding(dx: float, dy: float, dz: float, horizontal_sq: float) -> _Finding:
+    """Befund zu einem zu steilen Gleis."""
+    slope_percent = abs(dz / math.sqrt(horizontal_sq)) * 100
+    return _MSG_TRACK_STEEP.format(slope_percent), {"slope_percent": slope_percent}
+
+
+_DIMENSIONS = ("width", "height", "depth")
+
+# Plausibilitätsprüfungen der Beispielvalidatoren
+_FOUNDATION_CHECKS: Tuple[_CrossCheck, ...] = (
+    (
+        _DIMENSIONS,
+        lambda width, height, depth: width * height * depth < 0.1,
+        partial(_volume_finding, _MSG_VOLUME_SMALL),
+    ),
+    (
+        _DIMENSIONS,
+        lambda width, height, depth: width * height * depth > 100.0,
+        partial(_volume_finding, _MSG_VOLUME_LARGE),
+    ),
+    (
+        ("width", "height"),
+        lambda width, height: _height_ratio(width, height) > 5.0,
+        lambda width, height: (
+            _MSG_RATIO.format(_height_ratio(width, height)),
+            {"width": width, "height": height, "ratio": _height_ratio(width, height)},
+        ),
+    ),
+)
+
+_MAST_CHECKS: Tuple[_CrossCheck, ...] = (
+    (
+        ("height", "mast_type"),
+        lambda height, mast_type: mast_type == "Holzmast" and height > 15.0,
+        lambda height, mast_type: (
+            _MSG_WOOD_MAST_HIGH.format(height),
+            {"height": height, "mast_type": mast_type},
+        ),
+    ),
+    (
+        ("height", "mast_type"),
+        lambda height, mast_type: mast_type == "Stahlmast" and height < 5.0,
+        lambda height, mast_type: (
+            _MSG_STEEL_MAST_LOW.format(height),
+            {"height": height, "mast_type": mast_type},
+        ),
+    ),
+)
+
+_TRACK_CHECKS: Tuple[_CrossCheck, ...] = (
+    (
+        ("horizontal_sq", "dz", "start", "end"),
+        lambda horizontal_sq, dz, start, end: _is_track_short(horizontal_sq, dz),
+        _track_short_finding,
+    ),
+    (("dx", "dy", "dz", "horizontal_sq"), _is_track_steep, _track_steep_finding),
+)
+
+_TRACK_GAUGE_CHECKS: Tuple[_CrossCheck, ...] = (
+    (
+        ("track_type", "track_gauge"),
+        lambda track_type, track_gauge: (
+            track_type == "Hauptgleis" and not math.isclose(track_gauge, 1.435, abs_tol=0.01)
+        ),
+        lambda track_type, track_gauge: (
+            _MSG_TRACK_GAUGE.format(track_gauge),
+            {"track_gauge": track_gauge, "track_type": track_type},
+        ),
+    ),
+)
+
+
+@lru_cache(maxsize=4096)
+def _foundation_findings(
+    width: Optional[float], height: Optional[float], depth: Optional[float]
+) -> Tuple[_Finding, ...]:
+    """
+    Prüft Volumen und Höhe-zu-Breite-Verhältnis eines Fundaments.
+
+    Unveränderte Fundamente werden bei erneuter Validierung aus dem Cache bedient.
+
+    Parameters
+    ----------
+    width : Optional[float]
+        Breite des Fundaments
+    height : Optional[float]
+        Höhe des Fundaments
+    depth : Optional[float]
+        Tiefe des Fundaments
+
+    Returns
+    -------
+    Tuple[_Finding, ...]
+        Meldung und Kontext der gefundenen Auffälligkeiten
+    """
+    values = {"width": width, "height": height, "depth": depth}
+    return _run_cross_checks(_FOUNDATION_CHECKS, values)
+
+
+@lru_cache(maxsize=4096)
+def _track_findings(
+    x: float, y: float, z: float, x_end: float, y_end: float, z_end: float
+) -> Tuple[_Finding, ...]:
+    """
+    Prüft Länge und Steigung eines Gleises zwischen Start- und Endpunkt.
+
+    Parameters
+    ----------
+    x, y, z : float
+        Koordinaten des Startpunkts
+    x_end, y_end, z_end : float
+        Koordinaten des Endpunkts
+
+    Returns
+    -------
+    Tuple[_Finding, ...]
+        Meldung und Kontext der gefundenen Auffälligkeiten
+    """
+    # Schwellwerte werden mit quadrierten Distanzen geprüft, die horizontale
+    # Distanz nur einmal; die Wurzel wird nur für die Meldung gezogen
+    dx = x_end - x
+    dy = y_end - y
+    dz = z_end - z
+    values = {
+        "dx": dx,
+        "dy": dy,
+        "dz": dz,
+        "horizontal_sq": dx * dx + dy * dy,
+        "start": (x, y, z),
+        "end": (x_end, y_end, z_end),
+    }
+    return _run_cross_checks(_TRACK_CHECKS, values)
+
+
+def _foundation_candidates(
+    width: List[Optional[float]], height: List[Optional[float]], depth: List[Optional[float]]
+) -> np.ndarray:
+    """
+    Ermittelt vektorisiert die Fundamente mit auffälligem Volumen oder Verhältnis.
+
+    Fehlende Werte werden als NaN behandelt. Die Auswahl ist eine Obermenge, die
+    exakten Befunde liefert _foundation_findings für die ausgewählten Indizes.
+
+    Parameters
+    ----------
+    width, height, depth : List[Optional[float]]
+        Spalten mit Breite, Höhe und Tiefe der Fundamente
+
+    Returns
+    -------
+    np.ndarray
+        Indizes der zu prüfenden Fundamente
+    """
+    width_, height_, depth_ = (np.array(c, dtype=np.float64) for c in (width, height, depth))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        volume = width_ * height_ * depth_
+        ratio = np.where(width_ > 0, height_ / width_, np.inf)
+    return np.flatnonzero((volume < 0.1) | (volume > 100.0) | (ratio > 5.0))
+
+
+def _track_flags_kernel(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zs: np.ndarray,
+    xes: np.ndarray,
+    yes: np.ndarray,
+    zes: np.ndarray,
+) -> np.ndarray:
+    count = xs.shape[0]
+    out = np.zeros(count, dtype=np.bool_)
+    for i in prange(count):
+        dx = xes[i] - xs[i]
+        dy = yes[i] - ys[i]
+        dz = zes[i] - zs[i]
+        horizontal_sq = dx * dx + dy * dy
+        if horizontal_sq + dz * dz < 1.0:
+            out[i] = True
+        elif (abs(dx) > 0.001 or abs(dy) > 0.001) and dz * dz * 625.0 > horizontal_sq:
+            out[i] = True
+    return out
+
+
+# Ohne fastmath, damit NaN-Werte wie im Python-Pfad nie als auffällig gelten
+if njit is not None:
+    _track_flags_kernel = njit(parallel=True, cache=True)(_track_flags_kernel)
+
+
+def _track_candidates(coordinates: List[List[Optional[float]]]) -> np.ndarray:
+    """
+    Ermittelt vektorisiert die Gleise mit auffälliger Länge oder Steigung.
+
+    Fehlende Werte werden als NaN behandelt und nie als auffällig gemeldet. Mit
+    Numba läuft die Prüfung als kompilierter, paralleler Kernel, sonst mit NumPy.
+
+    Parameters
+    ----------
+    coordinates : List[List[Optional[float]]]
+        Spalten x, y, z, x_end, y_end, z_end der Gleise
+
+    Returns
+    -------
+    np.ndarray
+        Indizes der zu prüfenden Gleise
+    """
+    columns = [np.array(column, dtype=np.float64) for column in coordinates]
+    if njit is not None:
+        return np.flatnonzero(_track_flags_kernel(*columns))
+    x, y, z, x_end, y_end, z_end = columns
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        dx, dy, dz = x_end - x, y_end - y, z_end - z
+        horizontal = (np.abs(dx) > 0.001) | (np.abs(dy) > 0.001)
+        horizontal_sq = dx * dx + dy * dy
+        too_short = horizontal_sq + dz * dz < 1.0
+        too_steep = horizontal & (dz * dz * 625.0 > horizontal_sq)
+    return np.flatnonzero(too_short | too_steep)
+
+
 class FoundationValidator(ElementValidator):
     """
     Validiert speziell Foundation-Elemente mit zusätzlichen Prüfungen.
     """
 
+    FOUNDATION_TYPES = frozenset(
+        {"Block", "Platte", "Pfahl", "Streifenfundament", "Sonderfundament"}
+    )
+
+    _WANTED = {
+        ProcessEnum.WIDTH.value: "width",
+        ProcessEnum.HEIGHT.value: "height",
+        ProcessEnum.DEPTH.value: "depth",
+    }
+
     def __init__(self):
         """Initialisiert den FoundationValidator."""
         super().__init__(ElementType.FOUNDATION)
@@ -63,7 +406,7 @@ class FoundationValidator(ElementValidator):
         # Enum-Constraint für Foundation-Typ
         schema.add_enum_constraint(
             ProcessEnum.FOUNDATION_TYPE,
-            valid_values=["Block", "Platte", "Pfahl", "Streifenfundament", "Sonderfundament"],
+            valid_values=self.FOUNDATION_TYPES,
             message="Foundation-Typ {value} ist ungültig. "
             "Gültige Werte: Block, Platte, Pfahl, Streifenfundament, Sonderfundament",
         )
@@ -106,68 +449,63 @@ class FoundationValidator(ElementValidator):
         """
         super()._validate_specific(data, element_type, result, element_id)
 
-        # Parameter aus den Daten extrahieren
-        params = data.get("parameters", [])
-
-        # Dimensionen für Volumenberechnung
-        width, height, depth = None, None, None
-
-        for param in params:
-            if isinstance(param, dict):
-                process = param.get("process")
-                value = param.get("value")
-
-                if process == ProcessEnum.WIDTH.value:
-                    width = float(value) if value is not None else None
-                elif process == ProcessEnum.HEIGHT.value:
-                    height = float(value) if value is not None else None
-                elif process == ProcessEnum.DEPTH.value:
-                    depth = float(value) if value is not None else None
-
-        # Volumenprüfung
-        if width is not None and height is not None and depth is not None:
-            volume = width * height * depth
-            if volume < 0.1:
-                result.add_warning(
-                    ValidationWarning(
-                        message=f"Foundation-Volumen ist sehr klein: {volume:.2f}m³",
-                        context={
-                            "width": width,
-                            "height": height,
-                            "depth": depth,
-                            "volume": volume,
-                        },
-                        element_type=element_type.value,
-                        element_id=element_id,
-                    )
-                )
-            elif volume > 100.0:
-                result.add_warning(
-                    ValidationWarning(
-                        message=f"Foundation-Volumen ist sehr groß: {volume:.2f}m³",
-                        context={
-                            "width": width,
-                            "height": height,
-                            "depth": depth,
-                            "volume": volume,
-                        },
-                        element_type=element_type.value,
-                        element_id=element_id,
-                    )
-                )
+        width, height, depth = self._dimensions(data)
 
-        # Prüfung auf plausibles Höhe-zu-Breite-Verhältnis
+        # Ohne Breite und Höhe ist weder Volumen noch Verhältnis prüfbar
         if width is not None and height is not None:
-            ratio = height / width if width > 0 else float("inf")
-            if ratio > 5.0:
-                result.add_warning(
-                    ValidationWarning(
-                        message=f"Ungewöhnliches Höhe-zu-Breite-Verhältnis: {ratio:.2f}",
-                        context={"width": width, "height": height, "ratio": ratio},
-                        element_type=element_type.value,
-                        element_id=element_id,
-                    )
-                )
+            findings = _foundation_findings(width, height, depth)
+            _add_findings(result, findings, element_type, element_id)
+
+    def validate_batch(
+        self, data_list: List[Dict[str, Any]], element_type: str
+    ) -> List[ValidationResult]:
+        """
+        Validiert mehrere Foundation-Elemente und prüft die Volumina vektorisiert.
+
+        Parameters
+        ----------
+        data_list : List[Dict[str, Any]]
+            Die zu validierenden Elemente
+        element_type : str
+            Der Elementtyp
+
+        Returns
+        -------
+        List[ValidationResult]
+            Das Validierungsergebnis jedes Elements, in Eingabereihenfolge
+        """
+        results = []
+        pending = []
+        validated = self._validate_schemas(data_list, element_type)
+        for data, (result, element_enum, element_id) in zip(data_list, validated, strict=True):
+            results.append(result)
+            if element_enum is not None:
+                super()._validate_specific(data, element_enum, result, element_id)
+                pending.append((data, result, element_enum, element_id))
+
+        # Parameter spaltenweise für alle Elemente auf einmal auslesen
+        columns = self._extract_columns((item[0] for item in pending), self._WANTED)
+        width, height, depth = (
+            list(map(_as_float, columns[key])) for key in ("width", "height", "depth")
+        )
+
+        # Nur für auffällige Fundamente werden Warnungen erzeugt
+        for index in _foundation_candidates(width, height, depth).tolist():
+            if width[index] is None or height[index] is None:
+                continue
+            _, result, element_enum, element_id = pending[index]
+            findings = _foundation_findings(width[index], height[index], depth[index])
+            _add_findings(result, findings, element_enum, element_id)
+        return results
+
+    def _dimensions(self, data: Dict[str, Any]) -> Tuple[Optional[float], ...]:
+        """Liest Breite, Höhe und Tiefe für die Volumenberechnung aus den Daten."""
+        extracted = self._extract_values(data.get("parameters", []), self._WANTED)
+        return (
+            _as_float(extracted.get("width")),
+            _as_float(extracted.get("height")),
+            _as_float(extracted.get("depth")),
+        )
 
 
 class MastValidator(ElementValidator):
@@ -175,6 +513,13 @@ class MastValidator(ElementValidator):
     Validiert speziell Mast-Elemente mit zusätzlichen Prüfungen.
     """
 
+    MAST_TYPES = frozenset({"Stahlmast", "Betonmast", "Holzmast", "Gittermast", "Sondermast"})
+
+    _WANTED = {
+        ProcessEnum.HEIGHT.value: "height",
+        ProcessEnum.MAST_TYPE.value: "mast_type",
+    }
+
     def __init__(self):
         """Initialisiert den MastValidator."""
         super().__init__(ElementType.MAST)
@@ -225,7 +570,7 @@ class MastValidator(ElementValidator):
         # Enum-Constraint für Mast-Typ
         schema.add_enum_constraint(
             ProcessEnum.MAST_TYPE,
-            valid_values=["Stahlmast", "Betonmast", "Holzmast", "Gittermast", "Sondermast"],
+            valid_values=self.MAST_TYPES,
             message="Mast-Typ {value} ist ungültig. Gültige Werte: Stahlmast, "
             "Betonmast, Holzmast, Gittermast, Sondermast",
         )
@@ -257,17 +602,10 @@ class MastValidator(ElementValidator):
         params = data.get("parameters", [])
 
         # Relevante Parameter
-        height, mast_type, foundation_ref = None, None, None
-
-        for param in params:
-            if isinstance(param, dict):
-                process = param.get("process")
-                value = param.get("value")
-
-                if process == ProcessEnum.HEIGHT.value:
-                    height = float(value) if value is not None else None
-                elif process == ProcessEnum.MAST_TYPE.value:
-                    mast_type = value
+        extracted = self._extract_values(params, self._WANTED)
+        height = _as_float(extracted.get("height"))
+        mast_type = extracted.get("mast_type")
+        foundation_ref = None
 
         # Prüfung auf fehlende Foundation-Referenz
         if not foundation_ref:
@@ -281,26 +619,8 @@ class MastValidator(ElementValidator):
             )
 
         # Typ-spezifische Höhenprüfungen
-        if height is not None and mast_type is not None:
-            if mast_type == "Holzmast" and height > 15.0:
-                result.add_warning(
-                    ValidationWarning(
-                        message=f"Holzmast mit ungewöhnlicher Höhe: {height}m (üblich bis 15m)",
-                        context={"height": height, "mast_type": mast_type},
-                        element_type=element_type.value,
-                        element_id=element_id,
-                    )
-                )
-            elif mast_type == "Stahlmast" and height < 5.0:
-                result.add_warning(
-                    ValidationWarning(
-                        message=f"Stahlmast mit ungewöhnlich geringer Höhe: "
-                        f"{height}m (üblich ab 5m)",
-                        context={"height": height, "mast_type": mast_type},
-                        element_type=element_type.value,
-                        element_id=element_id,
-                    )
-                )
+        findings = _run_cross_checks(_MAST_CHECKS, {"height": height, "mast_type": mast_type})
+        _add_findings(result, findings, element_type, element_id)
 
 
 class TrackValidator(ElementValidator):
@@ -308,6 +628,19 @@ class TrackValidator(ElementValidator):
     Validiert speziell Track-Elemente mit zusätzlichen Prüfungen.
     """
 
+    TRACK_TYPES = frozenset({"Hauptgleis", "Nebengleis", "Abstellgleis", "Rangiergleis"})
+
+    _WANTED = {
+        ProcessEnum.X_COORDINATE.value: "x",
+        ProcessEnum.Y_COORDINATE.value: "y",
+        ProcessEnum.Z_COORDINATE.value: "z",
+        ProcessEnum.X_COORDINATE_END.value: "x_end",
+        ProcessEnum.Y_COORDINATE_END.value: "y_end",
+        ProcessEnum.Z_COORDINATE_END.value: "z_end",
+        ProcessEnum.TRACK_TYPE.value: "track_type",
+        ProcessEnum.TRACK_GAUGE.value: "track_gauge",
+    }
+
     def __init__(self):
         """Initialisiert den TrackValidator."""
         super().__init__(ElementType.TRACK)
@@ -368,7 +701,7 @@ class TrackValidator(ElementValidator):
         # Enum-Constraint für Gleistyp
         schema.add_enum_constraint(
             ProcessEnum.TRACK_TYPE,
-            valid_values=["Hauptgleis", "Nebengleis", "Abstellgleis", "Rangiergleis"],
+            valid_values=self.TRACK_TYPES,
             message="Gleistyp {value} ist ungültig. Gültige Werte: Hauptgleis, "
             "Nebengleis, Abstellgleis, Rangiergleis",
         )
@@ -396,37 +729,93 @@ class TrackValidator(ElementValidator):
         """
         super()._validate_specific(data, element_type, result, element_id)
 
-        # Parameter aus den Daten extrahieren
-        params = data.get("parameters", [])
+        values = self._track_values(data)
+        self._check_coordinates(values, element_type, result, element_id)
 
-        # Koordinaten für Längenberechnung
-        x, y, z = None, None, None
-        x_end, y_end, z_end = None, None, None
-        track_type, track_gauge = None, None
+        coordinates = values[:6]
+        if all(coordinates):
+            findings = _track_findings(*coordinates)
+            _add_findings(result, findings, element_type, element_id)
 
-        for param in params:
-            if not isinstance(param, dict):
-                continue
-            process = param.get("process")
-            value = param.get("value")
-
-            if process == ProcessEnum.X_COORDINATE.value:
-                x = float(value) if value is not None else None
-            elif process == ProcessEnum.Y_COORDINATE.value:
-                y = float(value) if value is not None else None
-            elif process == ProcessEnum.Z_COORDINATE.value:
-                z = float(value) if value is not None else None
-            elif process == ProcessEnum.X_COORDINATE_END.value:
-                x_end = float(value) if value is not None else None
-            elif process == ProcessEnum.Y_COORDINATE_END.value:
-                y_end = float(value) if value is not None else None
-            elif process == ProcessEnum.Z_COORDINATE_END.value:
-                z_end = float(value) if value is not None else None
-            elif process == ProcessEnum.TRACK_TYPE.value:
-                track_type = value
-            elif process == ProcessEnum.TRACK_GAUGE.value:
-                track_gauge = float(value) if value is not None else None
+        self._check_gauge(values, element_type, result, element_id)
+
+    def validate_batch(
+        self, data_list: List[Dict[str, Any]], element_type: str
+    ) -> List[ValidationResult]:
+        """
+        Validiert mehrere Track-Elemente und prüft Länge und Steigung vektorisiert.
+
+        Parameters
+        ----------
+        data_list : List[Dict[str, Any]]
+            Die zu validierenden Elemente
+        element_type : str
+            Der Elementtyp
+
+        Returns
+        -------
+        List[ValidationResult]
+            Das Validierungsergebnis jedes Elements, in Eingabereihenfolge
+        """
+        results = []
+        pending = []
+        validated = self._validate_schemas(data_list, element_type)
+        for data, (result, element_enum, element_id) in zip(data_list, validated, strict=True):
+            results.append(result)
+            if element_enum is not None:
+                super()._validate_specific(data, element_enum, result, element_id)
+                pending.append((data, result, element_enum, element_id))
+
+        # Parameter spaltenweise für alle Elemente auf einmal auslesen
+        columns = self._extract_columns((item[0] for item in pending), self._WANTED)
+        coordinates = [
+            list(map(_as_float, columns[key])) for key in ("x", "y", "z", "x_end", "y_end", "z_end")
+        ]
+        track_gauge = list(map(_as_float, columns["track_gauge"]))
+        rows = zip(*coordinates, columns["track_type"], track_gauge, strict=True)
+
+        # Nur für auffällige Gleise werden Längen- und Steigungswarnungen erzeugt
+        candidates = set(_track_candidates(coordinates).tolist())
+        for index, ((_, result, element_enum, element_id), values) in enumerate(
+            zip(pending, rows, strict=True)
+        ):
+            self._check_coordinates(values, element_enum, result, element_id)
+            if index in candidates and all(values[:6]):
+                findings = _track_findings(*values[:6])
+                _add_findings(result, findings, element_enum, element_id)
+            self._check_gauge(values, element_enum, result, element_id)
+        return results
+
+    def _track_values(self, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Liest Koordinaten, Gleistyp und Spurweite aus den Daten.
 
+        Returns
+        -------
+        Tuple[Any, ...]
+            (x, y, z, x_end, y_end, z_end, track_type, track_gauge)
+        """
+        extracted = self._extract_values(data.get("parameters", []), self._WANTED)
+        return (
+            _as_float(extracted.get("x")),
+            _as_float(extracted.get("y")),
+            _as_float(extracted.get("z")),
+            _as_float(extracted.get("x_end")),
+            _as_float(extracted.get("y_end")),
+            _as_float(extracted.get("z_end")),
+            extracted.get("track_type"),
+            _as_float(extracted.get("track_gauge")),
+        )
+
+    def _check_coordinates(
+        self,
+        values: Tuple[Any, ...],
+        element_type: ElementType,
+        result: ValidationResult,
+        element_id: Optional[str],
+    ) -> None:
+        """Warnt, wenn Start- oder Endkoordinaten unvollständig sind."""
+        x, y, z, x_end, y_end, z_end = values[:6]
         if x is None or y is None or z is None:
             result.add_warning(
                 ValidationWarning(
@@ -458,56 +847,56 @@ class TrackValidator(ElementValidator):
                 )
             )
 
-        if x and y and z and x_end and y_end and z_end:
-            # gleislänge berechnen
-            dx = x_end - x
-            dy = y_end - y
-            dz = z_end - z
-            length = math.sqrt(dx * dx + dy * dy + dz * dz)
-
-            # Zu kurzes Gleis?
-            if length < 1.0:
-                result.add_warning(
-                    ValidationWarning(
-                        message=f"Gleislänge ist sehr kurz: {length:.2f}m",
-                        context={
-                            "length": length,
-                            "start": (x, y, z),
-                            "end": (x_end, y_end, z_end),
-                        },
-                        element_type=element_type.value,
-                        element_id=element_id,
-                    )
-                )
+    def _check_gauge(
+        self,
+        values: Tuple[Any, ...],
+        element_type: ElementType,
+        result: ValidationResult,
+        element_id: Optional[str],
+    ) -> None:
+        """Warnt bei Hauptgleisen mit einer Spurweite abseits der Normalspur."""
+        gauge = {"track_type": values[6], "track_gauge": values[7]}
+        findings = _run_cross_checks(_TRACK_GAUGE_CHECKS, gauge)
+        _add_findings(result, findings, element_type, element_id)
+
+
+@lru_cache(maxsize=None)
+def get_foundation_validator() -> FoundationValidator:
+    """
+    Liefert den FoundationValidator, der einmal pro Prozess erstellt wird.
+
+    Returns
+    -------
+    FoundationValidator
+        Der gemeinsam genutzte Validator
+    """
+    return FoundationValidator()
+
+
+@lru_cache(maxsize=None)
+def get_mast_validator() -> MastValidator:
+    """
+    Liefert den MastValidator, der einmal pro Prozess erstellt wird.
+
+    Returns
+    -------
+    MastValidator
+        Der gemeinsam genutzte Validator
+    """
+    return MastValidator()
 
-            # Steigung/Gefälle berechnen
-            if abs(dx) > 0.001 or abs(dy) > 0.001:  # Vermeiden einer Division durch 0
-                horizontal_distance = math.sqrt(dx * dx + dy * dy)
-                slope_percent = abs(dz / horizontal_distance) * 100
-
-                # Zu steiles Gefälle?
-                if slope_percent > 4.0:
-                    result.add_warning(
-                        ValidationWarning(
-                            message=f"Gleissteigung ist sehr steil: {slope_percent:.2f}%",
-                            context={"slope_percent": slope_percent},
-                            element_type=element_type.value,
-                            element_id=element_id,
-                        )
-                    )
-
-        # Spurweitenprüfung für Hauptgleise
-        if track_type == "Hauptgleis" and track_gauge is not None:
-            if not math.isclose(track_gauge, 1.435, abs_tol=0.01):
-                result.add_warning(
-                    ValidationWarning(
-                        message=f"Hauptgleis mit ungewöhnlicher Spurweite: "
-                        f"{track_gauge}m (Normalspur: 1.435m)",
-                        context={"track_gauge": track_gauge, "track_type": track_type},
-                        element_type=element_type.value,
-                        element_id=element_id,
-                    )
-                )
+
+@lru_cache(maxsize=None)
+def get_track_validator() -> TrackValidator:
+    """
+    Liefert den TrackValidator, der einmal pro Prozess erstellt wird.
+
+    Returns
+    -------
+    TrackValidator
+        Der gemeinsam genutzte Validator
+    """
+    return TrackValidator()
 
 
 def example_usage():
@@ -519,14 +908,10 @@ def example_usage():
     # ValidationService erstellen
     validation_service = ValidationService()
 
-    # Validatoren erstellen und registrieren
-    foundation_validator = FoundationValidator()
-    mast_validator = MastValidator()
-    track_validator = TrackValidator()
-
-    validation_service.register_validator(foundation_validator)
-    validation_service.register_validator(mast_validator)
-    validation_service.register_validator(track_validator)
+    # Validatoren registrieren (Schemas werden nur beim ersten Aufruf aufgebaut)
+    validation_service.register_validator(get_foundation_validator())
+    validation_service.register_validator(get_mast_validator())
+    validation_service.register_validator(get_track_validator())
 
     # Beispiel für die Verwendung mit einem Plugin
     """
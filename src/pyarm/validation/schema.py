@@ -5,12 +5,23 @@ Dieses Modul stellt Klassen zur Verfügung, die Validierungsregeln und Constrain
 für verschiedene Elementtypen und deren Parameter definieren.
 """
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from pyarm.models.parameter import DataType, UnitEnum
 from pyarm.models.process_enums import ElementType, ProcessEnum
+from pyarm.validation.errors import ErrorSeverity
+
+
+@lru_cache(maxsize=None)
+def _pattern_matcher(pattern: Any) -> Callable[[str], Optional[re.Match]]:
+    """Kompiliert ein Regex-Muster einmal pro Prozess und liefert dessen match-Funktion."""
+    return re.compile(pattern).match
 
 
 class ConstraintType(Enum):
@@ -27,7 +38,7 @@ class ConstraintType(Enum):
     CUSTOM = auto()  # Custom validation function
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """Repräsentiert eine Validierungsregel für einen Parameter."""
 
@@ -84,14 +95,15 @@ class Constraint:
             return min_val <= param_value <= max_val
 
         elif self.constraint_type == ConstraintType.REGEX:
-            import re
-
-            pattern = self.value
-            return bool(re.match(pattern, str(param_value)))
+            return bool(_pattern_matcher(self.value)(str(param_value)))
 
         elif self.constraint_type == ConstraintType.ENUM:
             valid_values = self.value
-            return param_value in valid_values
+            try:
+                return param_value in valid_values
+            except TypeError:
+                # Nicht hashbare Werte können nicht in einem (frozen)set enthalten sein
+                return False
 
         elif self.constraint_type == ConstraintType.CUSTOM:
             if self.custom_validator is not None:
@@ -100,6 +112,74 @@ class Constraint:
 
         return False  # Unknown constraint type
 
+    def compile(self) -> Callable[[Any], bool]:
+        """
+        Erstellt eine auf den Constraint-Typ spezialisierte Prüffunktion.
+
+        Die Prüffunktion verhält sich wie validate, die Fallunterscheidung nach
+        dem Constraint-Typ wird aber nur einmal beim Erstellen durchlaufen.
+
+        Rückgabe
+        -------
+        Callable[[Any], bool]
+            Funktion, die True liefert, wenn der Wert den Constraint erfüllt
+        """
+        constraint_type = self.constraint_type
+        expected = self.value
+
+        if constraint_type == ConstraintType.REQUIRED:
+            return lambda value: value is not None
+
+        if constraint_type == ConstraintType.TYPE:
+            if expected == DataType.FLOAT:
+                expected_types: Any = (int, float)
+            elif expected == DataType.INTEGER:
+                expected_types = int
+            elif expected == DataType.STRING:
+                expected_types = str
+            elif expected == DataType.BOOLEAN:
+                expected_types = bool
+            else:
+                return lambda value: value is None
+            return lambda value: value is None or isinstance(value, expected_types)
+
+        if constraint_type == ConstraintType.UNIT:
+            return lambda value: True
+
+        if constraint_type == ConstraintType.MIN_VALUE:
+            return lambda value: value is None or value >= expected
+
+        if constraint_type == ConstraintType.MAX_VALUE:
+            return lambda value: value is None or value <= expected
+
+        if constraint_type == ConstraintType.RANGE:
+            min_val, max_val = expected
+            return lambda value: value is None or min_val <= value <= max_val
+
+        if constraint_type == ConstraintType.REGEX:
+            match = _pattern_matcher(expected)
+            return lambda value: value is None or bool(match(str(value)))
+
+        if constraint_type == ConstraintType.ENUM:
+
+            def is_valid_value(value: Any) -> bool:
+                if value is None:
+                    return True
+                try:
+                    return value in expected
+                except TypeError:
+                    return False
+
+            return is_valid_value
+
+        if constraint_type == ConstraintType.CUSTOM:
+            custom_validator = self.custom_validator
+            if custom_validator is None:
+                return lambda value: value is None
+            return lambda value: value is None or custom_validator(value)
+
+        return lambda value: value is None
+
     def get_error_message(self, param_name: str, value: Any) -> str:
         """
         Gibt eine Fehlermeldung für einen verletzten Constraint zurück.
@@ -175,7 +255,46 @@ class Constraint:
         return f"Unbekannter Validierungsfehler für Parameter '{param_name}'"
 
 
-@dataclass
+# Prüffunktion, Constraint und Schweregrad einer vorkompilierten Prüfung
+CompiledCheck = Tuple[Callable[[Any], bool], Constraint, ErrorSeverity]
+
+# Parametername und seine vorkompilierten Prüfungen
+CompiledConstraints = Tuple[str, Tuple[CompiledCheck, ...]]
+
+
+def _severity_of(constraint: Constraint) -> ErrorSeverity:
+    """Fehlende Pflichtparameter sind kritisch, alle anderen Verletzungen Fehler."""
+    if constraint.constraint_type == ConstraintType.REQUIRED:
+        return ErrorSeverity.CRITICAL
+    return ErrorSeverity.ERROR
+
+
+# Parameternamen mit den zugehörigen Unter- und Obergrenzen als NumPy-Arrays
+RangeTable = Tuple[Tuple[str, ...], np.ndarray, np.ndarray]
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) is float or type(value) is int
+
+
+def _numeric_bounds(constraint: Constraint) -> Optional[Tuple[float, float]]:
+    """Liefert die Grenzen eines MIN_VALUE-, MAX_VALUE- oder RANGE-Constraints mit Zahlen."""
+    constraint_type, value = constraint.constraint_type, constraint.value
+    if constraint_type == ConstraintType.MIN_VALUE and _is_number(value):
+        return float(value), float("inf")
+    if constraint_type == ConstraintType.MAX_VALUE and _is_number(value):
+        return float("-inf"), float(value)
+    if (
+        constraint_type == ConstraintType.RANGE
+        and isinstance(value, tuple)
+        and len(value) == 2
+        and all(map(_is_number, value))
+    ):
+        return float(value[0]), float(value[1])
+    return None
+
+
+@dataclass(slots=True)
 class SchemaDefinition:
     """
     Schema zur Definition der Validierungsregeln für Elementtypen.
@@ -196,6 +315,12 @@ class SchemaDefinition:
     # Validierungsconstraints für Parameter
     constraints: Dict[ProcessEnum, List[Constraint]] = field(default_factory=dict)
 
+    # Vorkompilierte Prüfungen, werden von den add_*-Methoden zurückgesetzt
+    _compiled: Dict[bool, Tuple[CompiledConstraints, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _ranges: Optional[RangeTable] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Initialisiert die Constraints basierend auf den anderen Eigenschaften."""
         # Für alle erforderlichen Parameter einen REQUIRED-Constraint erstellen
@@ -245,6 +370,75 @@ class SchemaDefinition:
             )
             self.constraints[param_enum].append(unit_constraint)
 
+    def compiled_constraints(self, include_ranges: bool = True) -> Tuple[CompiledConstraints, ...]:
+        """
+        Liefert die Constraints als vorkompilierte Prüfungen je Parameter.
+
+        Die Prüfungen werden beim ersten Aufruf erstellt und wiederverwendet, bis ein
+        Constraint über eine der add_*-Methoden hinzugefügt wird. Wer constraints
+        direkt verändert, muss danach invalidate aufrufen.
+
+        Parameter
+        ----------
+        include_ranges : bool
+            False lässt die Zahlengrenzen aus compiled_ranges weg, z.B. wenn diese
+            bereits vektorisiert geprüft wurden
+
+        Rückgabe
+        -------
+        Tuple[CompiledConstraints, ...]
+            Parametername und die Prüfungen (Prüffunktion, Constraint, Schweregrad)
+        """
+        compiled = self._compiled.get(include_ranges)
+        if compiled is None:
+            plan = []
+            for param_enum, constraints in self.constraints.items():
+                checks = tuple(
+                    (constraint.compile(), constraint, _severity_of(constraint))
+                    for constraint in constraints
+                    if include_ranges or _numeric_bounds(constraint) is None
+                )
+                if checks:
+                    plan.append((param_enum.value, checks))
+            compiled = self._compiled[include_ranges] = tuple(plan)
+        return compiled
+
+    def compiled_ranges(self) -> RangeTable:
+        """
+        Liefert die Zahlengrenzen der Parameter als parallele NumPy-Arrays.
+
+        MIN_VALUE-, MAX_VALUE- und RANGE-Constraints eines Parameters werden zu einem
+        geschlossenen Intervall zusammengefasst, sodass eine ganze Sammlung mit
+        ``(werte >= unten) & (werte <= oben)`` geprüft werden kann.
+
+        Rückgabe
+        -------
+        RangeTable
+            Parameternamen, Untergrenzen und Obergrenzen
+        """
+        ranges = self._ranges
+        if ranges is None:
+            bounds: Dict[str, Tuple[float, float]] = {}
+            for param_enum, constraints in self.constraints.items():
+                for constraint in constraints:
+                    numeric_bounds = _numeric_bounds(constraint)
+                    if numeric_bounds is None:
+                        continue
+                    low, high = bounds.get(param_enum.value, (float("-inf"), float("inf")))
+                    bounds[param_enum.value] = (
+                        max(low, numeric_bounds[0]),
+                        min(high, numeric_bounds[1]),
+                    )
+            lows = np.array([low for low, _ in bounds.values()], dtype=np.float64)
+            highs = np.array([high for _, high in bounds.values()], dtype=np.float64)
+            ranges = self._ranges = (tuple(bounds), lows, highs)
+        return ranges
+
+    def invalidate(self) -> None:
+        """Verwirft die vorkompilierten Prüfungen nach direkten Änderungen."""
+        self._compiled.clear()
+        self._ranges = None
+
     def add_constraint(self, param_enum: ProcessEnum, constraint: Constraint) -> None:
         """
         Fügt einen Constraint für einen Parameter hinzu.
@@ -259,6 +453,7 @@ class SchemaDefinition:
         if param_enum not in self.constraints:
             self.constraints[param_enum] = []
         self.constraints[param_enum].append(constraint)
+        self.invalidate()
 
     def add_range_constraint(
         self,
@@ -291,6 +486,7 @@ class SchemaDefinition:
             or f"Parameter '{{param_name}}' muss zwischen {min_value} und {max_value} liegen",
         )
         self.constraints[param_enum].append(constraint)
+        self.invalidate()
 
     def add_regex_constraint(
         self, param_enum: ProcessEnum, pattern: str, message: Optional[str] = None
@@ -317,9 +513,13 @@ class SchemaDefinition:
             or f"Parameter '{{param_name}}' muss dem Muster '{pattern}' entsprechen",
         )
         self.constraints[param_enum].append(constraint)
+        self.invalidate()
 
     def add_enum_constraint(
-        self, param_enum: ProcessEnum, valid_values: List[Any], message: Optional[str] = None
+        self,
+        param_enum: ProcessEnum,
+        valid_values: Collection[Any],
+        message: Optional[str] = None,
     ) -> None:
         """
         Fügt einen Enum-Constraint für einen Parameter hinzu.
@@ -328,8 +528,8 @@ class SchemaDefinition:
         ----------
         param_enum : ProcessEnum
             Der Parameter-Enum, für den der Constraint gilt
-        valid_values : List[Any]
-            Die gültigen Werte
+        valid_values : Collection[Any]
+            Die gültigen Werte; ein frozenset ermöglicht eine Prüfung in O(1)
         message : Optional[str]
             Optionale benutzerdefinierte Fehlermeldung
         """
@@ -344,6 +544,7 @@ class SchemaDefinition:
             f"{', '.join(map(str, valid_values))}",
         )
         self.constraints[param_enum].append(constraint)
+        self.invalidate()
 
     def add_custom_constraint(
         self, param_enum: ProcessEnum, validator: Callable[[Any], bool], message: str
@@ -367,3 +568,4 @@ class SchemaDefinition:
             constraint_type=ConstraintType.CUSTOM, custom_validator=validator, message=message
         )
         self.constraints[param_enum].append(constraint)
+        self.invalidate()
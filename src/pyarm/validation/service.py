@@ -6,22 +6,57 @@ Validatoren hinweg und bietet eine zentrale Schnittstelle für die Validierung.
 """
 
 import logging
-from typing import Any, Dict, List
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
 from pyarm.validation.errors import ErrorSeverity, ValidationResult, ValidationWarning
 from pyarm.validation.interfaces import IValidationService, IValidator
 
 log = logging.getLogger(__name__)
 
+# Service des Worker-Prozesses, beim Start des Prozesses übernommen
+_worker_service: Optional["ValidationService"] = None
+
+
+def _init_worker(service: "ValidationService") -> None:
+    """Übernimmt den Service des Elternprozesses im Worker-Prozess."""
+    global _worker_service
+    _worker_service = service
+
+
+def _validate_chunk(data: List[Dict[str, Any]], element_type: str) -> List[ValidationResult]:
+    """Validiert einen Teil einer Sammlung im Worker-Prozess."""
+    return [_worker_service.validate_element(item, element_type) for item in data]
+
 
 class ValidationService(IValidationService):
     """
     Service zur Koordination von Validatoren und zur Durchführung von Validierungen.
     """
 
-    def __init__(self):
-        """Initialisiert den ValidationService."""
+    # Ab dieser Anzahl Elemente wird eine Sammlung auf Worker-Prozesse verteilt
+    PARALLEL_MIN_ELEMENTS = 5000
+    # Mindestgröße eines Teils, der an einen Worker-Prozess übergeben wird
+    PARALLEL_MIN_CHUNK = 500
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialisiert den ValidationService.
+
+        Parameters
+        ----------
+        max_workers : Optional[int]
+            Anzahl Worker-Prozesse für große Sammlungen, None oder 1 validiert
+            immer im aktuellen Prozess
+        """
         self._validators: List[IValidator] = []
+        self._max_workers = max_workers
+        # Validatoren pro Elementtyp, bei Registrierung eines Validators verworfen
+        self._by_type: Dict[str, Tuple[IValidator, ...]] = {}
 
     def register_validator(self, validator: IValidator) -> None:
         """
@@ -33,8 +68,10 @@ class ValidationService(IValidationService):
             Der zu registrierende Validator
         """
         self._validators.append(validator)
-        supported_types = ", ".join([str(t) for t in validator.supported_element_types])
-        log.info(f"Validator für Elementtypen [{supported_types}] registriert")
+        self._by_type.clear()
+        if log.isEnabledFor(logging.INFO):
+            supported_types = ", ".join([str(t) for t in validator.supported_element_types])
+            log.info("Validator für Elementtypen [%s] registriert", supported_types)
 
     def get_validators_for_type(self, element_type: str) -> List[IValidator]:
         """
@@ -50,7 +87,15 @@ class ValidationService(IValidationService):
         List[IValidator]
             Liste von Validatoren, die den Elementtyp validieren können
         """
-        return [v for v in self._validators if v.can_validate(element_type)]
+        return list(self._validators_for(element_type))
+
+    def _validators_for(self, element_type: str) -> Tuple[IValidator, ...]:
+        """Liefert die Validatoren eines Elementtyps als unveränderliches Tupel."""
+        validators = self._by_type.get(element_type)
+        if validators is None:
+            validators = tuple(v for v in self._validators if v.can_validate(element_type))
+            self._by_type[element_type] = validators
+        return validators
 
     def validate_element(self, data: Dict[str, Any], element_type: str) -> ValidationResult:
         """
@@ -71,7 +116,7 @@ class ValidationService(IValidationService):
         result = ValidationResult()
 
         # Validatoren für diesen Elementtyp suchen
-        validators = self.get_validators_for_type(element_type)
+        validators = self._validators_for(element_type)
 
         if not validators:
             result.add_warning(
@@ -83,9 +128,7 @@ class ValidationService(IValidationService):
             return result
 
         # Alle Validatoren ausführen und Ergebnisse zusammenführen
-        for validator in validators:
-            validator_result = validator.validate(data, element_type)
-            result.merge(validator_result)
+        result.merge_many(validator.validate(data, element_type) for validator in validators)
 
         return result
 
@@ -107,35 +150,147 @@ class ValidationService(IValidationService):
         List[ValidationResult]
             Die Validierungsergebnisse für jedes Element
         """
-        results = []
-
-        for i, element_data in enumerate(data):
-            # Element-ID für Logging extrahieren
-            element_id = element_data.get("id", element_data.get("uuid", f"Element-{i + 1}"))
-            log.debug(f"Validiere {element_type} {element_id}")
-
-            # Element validieren
-            result = self.validate_element(element_data, element_type)
-            results.append(result)
+        if self._use_workers(data):
+            results = self._validate_in_workers(data, element_type)
+        else:
+            results = [self.validate_element(element_data, element_type) for element_data in data]
+
+        # Pegel einmal abfragen, damit abgeschaltete Meldungen keine Arbeit verursachen
+        log_debug = log.isEnabledFor(logging.DEBUG)
+        log_critical = log.isEnabledFor(logging.ERROR)
+        log_errors = log.isEnabledFor(logging.WARNING)
+        log_warnings = log.isEnabledFor(logging.INFO)
+
+        for i, (element_data, result) in enumerate(zip(data, results, strict=True)):
+            if log_debug:
+                # Element-ID für Logging extrahieren
+                element_id = element_data.get("id", element_data.get("uuid", f"Element-{i + 1}"))
+                log.debug("Validiert %s %s", element_type, element_id)
 
             # Schwerwiegende Fehler loggen
-            for error in result.errors:
-                if error.severity == ErrorSeverity.CRITICAL:
-                    log.error(f"Kritischer Validierungsfehler: {error}")
-                elif error.severity == ErrorSeverity.ERROR:
-                    log.warning(f"Validierungsfehler: {error}")
+            if log_critical:
+                for error in result.errors:
+                    if error.severity == ErrorSeverity.CRITICAL:
+                        log.error("Kritischer Validierungsfehler: %s", error)
+                    elif log_errors and error.severity == ErrorSeverity.ERROR:
+                        log.warning("Validierungsfehler: %s", error)
 
             # Warnungen loggen
-            for warning in result.warnings:
-                log.info(f"Validierungswarnung: {warning}")
+            if log_warnings:
+                for warning in result.warnings:
+                    log.info("Validierungswarnung: %s", warning)
 
         # Zusammenfassung loggen
+        if log_warnings:
+            valid_count = sum(1 for result in results if result.is_valid)
+            log.info(
+                "Validierungsergebnis: %s von %s %s-Elementen valide",
+                valid_count,
+                len(results),
+                element_type,
+            )
+
+        return results
+
+    def _use_workers(self, data: List[Dict[str, Any]]) -> bool:
+        """Prüft, ob eine Sammlung auf Worker-Prozesse verteilt wird."""
+        if self._max_workers is None or self._max_workers < 2:
+            return False
+        if len(data) < self.PARALLEL_MIN_ELEMENTS:
+            return False
+        # Validatoren enthalten vorkompilierte Closures, die nicht serialisierbar sind;
+        # nur mit fork übernehmen die Worker den Service ohne Serialisierung. Fork wird
+        # explizit angefordert, auch wenn die Standard-Startmethode eine andere ist
+        # (forkserver ab Python 3.14 unter Linux). Ohne fork (Windows) wird im
+        # aktuellen Prozess validiert
+        if "fork" not in multiprocessing.get_all_start_methods():
+            log.debug("Keine Worker-Prozesse ohne fork, validiere im aktuellen Prozess")
+            return False
+        return True
+
+    def _validate_in_workers(
+        self, data: List[Dict[str, Any]], element_type: str
+    ) -> List[ValidationResult]:
+        """
+        Validiert eine Sammlung in Teilen auf Worker-Prozessen.
+
+        Parameters
+        ----------
+        data : List[Dict[str, Any]]
+            Die zu validierenden Elemente
+        element_type : str
+            Der Elementtyp
+
+        Returns
+        -------
+        List[ValidationResult]
+            Die Validierungsergebnisse für jedes Element, in Eingabereihenfolge
+        """
+        workers = self._max_workers
+        chunk_size = max(self.PARALLEL_MIN_CHUNK, -(-len(data) // workers))
+        chunks = [data[start : start + chunk_size] for start in range(0, len(data), chunk_size)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as executor:
+                chunk_results = executor.map(_validate_chunk, chunks, [element_type] * len(chunks))
+                return list(chain.from_iterable(chunk_results))
+        except (BrokenProcessPool, OSError) as error:
+            log.warning(
+                "Worker-Prozesse fehlgeschlagen (%s), validiere im aktuellen Prozess", error
+            )
+            return [self.validate_element(element_data, element_type) for element_data in data]
+
+    def validate_collection_vectorized(
+        self, data: List[Dict[str, Any]], element_type: str
+    ) -> List[ValidationResult]:
+        """
+        Validiert eine Sammlung von Elementen spaltenweise.
+
+        Validatoren mit einer Methode ``validate_batch`` prüfen alle Elemente auf
+        einmal, z.B. numerische Plausibilitätsprüfungen mit NumPy. Die Ergebnisse
+        entsprechen denen von validate_collection, einzelne Fehler und Warnungen
+        werden jedoch nicht geloggt.
+
+        Parameters
+        ----------
+        data : List[Dict[str, Any]]
+            Die zu validierenden Elemente
+        element_type : str
+            Der Elementtyp
+
+        Returns
+        -------
+        List[ValidationResult]
+            Die Validierungsergebnisse für jedes Element
+        """
+        validators = self._validators_for(element_type)
+        if not validators:
+            return [self.validate_element(element_data, element_type) for element_data in data]
+
+        batches = []
+        for validator in validators:
+            validate_batch = getattr(validator, "validate_batch", None)
+            if validate_batch is not None:
+                batches.append(validate_batch(data, element_type))
+            else:
+                batches.append([validator.validate(d, element_type) for d in data])
+
+        # Ergebnisse aller Validatoren pro Element in einem Durchgang zusammenführen
+        results = [ValidationResult() for _ in data]
+        for result, element_results in zip(results, zip(*batches, strict=True), strict=True):
+            result.merge_many(element_results)
+
         valid_count = sum(1 for result in results if result.is_valid)
         log.info(
-            f"Validierungsergebnis: {valid_count} von "
-            f"{len(results)} {element_type}-Elementen valide"
+            "Validierungsergebnis: %s von %s %s-Elementen valide",
+            valid_count,
+            len(results),
+            element_type,
         )
-
         return results
 
     def get_validation_summary(self, results: List[ValidationResult]) -> Dict[str, Any]:
@@ -156,18 +311,11 @@ class ValidationService(IValidationService):
         valid = sum(1 for result in results if result.is_valid)
         invalid = total - valid
 
-        # Fehler nach Schweregrad zählen
-        error_counts = {
-            ErrorSeverity.CRITICAL.name: 0,
-            ErrorSeverity.ERROR.name: 0,
-            ErrorSeverity.WARNING.name: 0,
-        }
-
-        for result in results:
-            for error in result.errors:
-                error_counts[error.severity.name] += 1
-            for warning in result.warnings:
-                error_counts[warning.severity.name] += 1
+        # Fehler nach Schweregrad zählen, Namen erst am Ende auflösen
+        severity_counts = Counter(
+            error.severity for result in results for error in chain(result.errors, result.warnings)
+        )
+        error_counts = {severity.name: severity_counts[severity] for severity in ErrorSeverity}
 
         return {
             "total_elements": total,
@@ -8,7 +8,9 @@ validators.
 
 import abc
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from pyarm.models.parameter import DataType, UnitEnum
 from pyarm.models.process_enums import ElementType, ProcessEnum
@@ -19,10 +21,67 @@ from pyarm.validation.errors import (
     ValidationWarning,
 )
 from pyarm.validation.interfaces import IValidator
-from pyarm.validation.schema import Constraint, ConstraintType, SchemaDefinition
+from pyarm.validation.schema import (
+    CompiledConstraints,
+    Constraint,
+    ConstraintType,
+    SchemaDefinition,
+)
 
 log = logging.getLogger(__name__)
 
+# Prozesswerte der Start- und Endkoordinaten von Linienelementen
+_LINE_POINTS: Dict[str, str] = {
+    ProcessEnum.X_COORDINATE.value: "x",
+    ProcessEnum.Y_COORDINATE.value: "y",
+    ProcessEnum.Z_COORDINATE.value: "z",
+    ProcessEnum.X_COORDINATE_END.value: "x_end",
+    ProcessEnum.Y_COORDINATE_END.value: "y_end",
+    ProcessEnum.Z_COORDINATE_END.value: "z_end",
+}
+
+# Elementtypen mit Start- und Endpunkt
+_LINE_ELEMENT_TYPES = frozenset({ElementType.TRACK, ElementType.SEWER_PIPE})
+
+# Ergebnis der Vorprüfung: Ergebnis, Elementtyp, Element-ID und Parameter nach Name
+_Prepared = Tuple[ValidationResult, Optional[ElementType], Optional[str], Dict[str, Dict[str, Any]]]
+
+
+def _within_bounds(
+    params_dicts: Sequence[Dict[str, Dict[str, Any]]],
+    names: Sequence[str],
+    lows: np.ndarray,
+    highs: np.ndarray,
+) -> Optional[List[bool]]:
+    """
+    Checks vectorized which elements keep all numeric bounds of a schema.
+
+    Parameters
+    ----------
+    params_dicts : Sequence[Dict[str, Dict[str, Any]]]
+        The parameters of each element by name
+    names : Sequence[str]
+        The names of the bounded parameters
+    lows, highs : np.ndarray
+        The lower and upper bound of each name
+
+    Returns
+    -------
+    Optional[List[bool]]
+        Per element whether all bounds are kept, or None if the values do not form
+        a numeric matrix (missing or non-numeric values) and must be checked one by one
+    """
+    try:
+        matrix = [[params[name]["value"] for name in names] for params in params_dicts]
+        values = np.array(matrix)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if values.dtype.kind not in "biuf" or values.shape != (len(matrix), len(names)):
+        return None
+    with np.errstate(invalid="ignore"):
+        within = (values >= lows) & (values <= highs)
+    return within.all(axis=1).tolist()
+
 
 class GenericValidator(abc.ABC, IValidator):
     """
@@ -93,6 +152,117 @@ class GenericValidator(abc.ABC, IValidator):
         ValidationResult
             The validation result
         """
+        result, element_enum, element_id = self._validate_schema(data, element_type)
+        if element_enum is not None:
+            # Zusätzliche spezifische Validierung durchführen
+            self._validate_specific(data, element_enum, result, element_id)
+        return result
+
+    def validate_batch(
+        self, data_list: List[Dict[str, Any]], element_type: str
+    ) -> List[ValidationResult]:
+        """
+        Validates several elements of the same element type.
+
+        Derived classes can override this method to run their checks on whole columns.
+
+        Parameters
+        ----------
+        data_list : List[Dict[str, Any]]
+            The elements to validate
+        element_type : str
+            The element type
+
+        Returns
+        -------
+        List[ValidationResult]
+            The validation result of each element, in input order
+        """
+        results = []
+        validated = self._validate_schemas(data_list, element_type)
+        for data, (result, element_enum, element_id) in zip(data_list, validated, strict=True):
+            if element_enum is not None:
+                self._validate_specific(data, element_enum, result, element_id)
+            results.append(result)
+        return results
+
+    def _validate_schemas(
+        self, data_list: List[Dict[str, Any]], element_type: str
+    ) -> List[Tuple[ValidationResult, Optional[ElementType], Optional[str]]]:
+        """
+        Validates several elements against the registered schema of the element type.
+
+        The numeric bounds of the schema are checked for all elements at once; only
+        elements outside a bound or with non-numeric values run the bound checks again
+        one by one to report the errors.
+
+        Parameters
+        ----------
+        data_list : List[Dict[str, Any]]
+            The data to validate
+        element_type : str
+            The element type
+
+        Returns
+        -------
+        List[Tuple[ValidationResult, Optional[ElementType], Optional[str]]]
+            Per element as returned by _validate_schema
+        """
+        prepared = [self._prepare(data, element_type) for data in data_list]
+        checked = [item for item in prepared if item[1] is not None]
+        if checked:
+            schema = self._schemas[checked[0][1]]
+            names, lows, highs = schema.compiled_ranges()
+            within = _within_bounds([item[3] for item in checked], names, lows, highs)
+            all_checks = schema.compiled_constraints()
+            unbounded_checks = schema.compiled_constraints(include_ranges=False)
+            for index, (result, _, element_id, params_dict) in enumerate(checked):
+                plan = unbounded_checks if within and within[index] else all_checks
+                self._check_constraints(plan, params_dict, result, element_type, element_id)
+        return [item[:3] for item in prepared]
+
+    def _validate_schema(
+        self, data: Dict[str, Any], element_type: str
+    ) -> Tuple[ValidationResult, Optional[ElementType], Optional[str]]:
+        """
+        Validates data against the registered schema of the element type.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The data to validate
+        element_type : str
+            The element type
+
+        Returns
+        -------
+        Tuple[ValidationResult, Optional[ElementType], Optional[str]]
+            The validation result, the element type (None if the specific
+            validation must be skipped) and the ID of the element
+        """
+        result, element_enum, element_id, params_dict = self._prepare(data, element_type)
+        if element_enum is not None:
+            plan = self._schemas[element_enum].compiled_constraints()
+            self._check_constraints(plan, params_dict, result, element_type, element_id)
+        return result, element_enum, element_id
+
+    def _prepare(self, data: Dict[str, Any], element_type: str) -> _Prepared:
+        """
+        Checks the element type and the structure of the data and indexes the parameters.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The data to validate
+        element_type : str
+            The element type
+
+        Returns
+        -------
+        _Prepared
+            The validation result, the element type (None if the validation must
+            stop), the ID of the element and the parameters by name
+        """
         result = ValidationResult()
 
         try:
@@ -105,7 +275,7 @@ class GenericValidator(abc.ABC, IValidator):
                     severity=ErrorSeverity.CRITICAL,
                 )
             )
-            return result
+            return result, None, None, {}
 
         # Prüfen, ob ein Schema für diesen Elementtyp registriert ist
         schema = self._schemas.get(element_enum)
@@ -116,7 +286,7 @@ class GenericValidator(abc.ABC, IValidator):
                     context={"element_type": element_type},
                 )
             )
-            return result
+            return result, None, None, {}
 
         # Basis-Struktur prüfen
         if not isinstance(data, dict):
@@ -128,7 +298,7 @@ class GenericValidator(abc.ABC, IValidator):
                     element_type=element_type,
                 )
             )
-            return result
+            return result, None, None, {}
 
         # Element-ID extrahieren für Fehlermeldungen
         element_id = data.get("id", data.get("uuid", data.get("ID", None)))
@@ -150,30 +320,42 @@ class GenericValidator(abc.ABC, IValidator):
                 continue
             params_dict[param_name] = param
 
-        # Alle erforderlichen Parameter und ihre Constraints prüfen
-        for param_enum, constraints in schema.constraints.items():
-            param_name = param_enum.value
+        return result, element_enum, element_id, params_dict
+
+    @staticmethod
+    def _check_constraints(
+        plan: Tuple[CompiledConstraints, ...],
+        params_dict: Dict[str, Dict[str, Any]],
+        result: ValidationResult,
+        element_type: str,
+        element_id: Optional[str],
+    ) -> None:
+        """
+        Runs the precompiled constraint checks of a schema on the parameters of an element.
 
+        Parameters
+        ----------
+        plan : Tuple[CompiledConstraints, ...]
+            The precompiled checks by parameter name
+        params_dict : Dict[str, Dict[str, Any]]
+            The parameters of the element by name
+        result : ValidationResult
+            The validation result to which errors are added
+        element_type : str
+            The element type
+        element_id : Optional[str]
+            The ID of the element, if available
+        """
+        for param_name, checks in plan:
             # Parameter-Wert suchen
-            param_value = None
             param_data = params_dict.get(param_name)
+            param_value = param_data.get("value") if param_data else None
 
-            if param_data:
-                param_value = param_data.get("value")
-
-            # Alle Constraints für diesen Parameter prüfen
-            for constraint in constraints:
-                if not constraint.validate(param_value):
-                    error_message = constraint.get_error_message(param_name, param_value)
-
-                    # Bestimmen des Schweregrads basierend auf dem Constraint-Typ
-                    severity = ErrorSeverity.ERROR
-                    if constraint.constraint_type == ConstraintType.REQUIRED:
-                        severity = ErrorSeverity.CRITICAL
-
+            for check, constraint, severity in checks:
+                if not check(param_value):
                     result.add_error(
                         ValidationError(
-                            message=error_message,
+                            message=constraint.get_error_message(param_name, param_value),
                             context={"param_name": param_name, "value": param_value},
                             severity=severity,
                             element_type=element_type,
@@ -182,11 +364,6 @@ class GenericValidator(abc.ABC, IValidator):
                         )
                     )
 
-        # Zusätzliche spezifische Validierung durchführen
-        self._validate_specific(data, element_enum, result, element_id)
-
-        return result
-
     @abc.abstractmethod
     def _validate_specific(
         self,
@@ -225,6 +402,64 @@ class ElementValidator(GenericValidator):
         schema = self._create_default_schema(element_type)
         self.register_schema(schema)
 
+    @staticmethod
+    def _extract_values(params: Iterable[Any], wanted: Mapping[str, str]) -> Dict[str, Any]:
+        """
+        Extracts the values of the wanted processes in a single pass.
+
+        Parameters
+        ----------
+        params : Iterable[Any]
+            The parameter dictionaries of the element
+        wanted : Mapping[str, str]
+            Mapping of process value to the key in the returned dictionary
+
+        Returns
+        -------
+        Dict[str, Any]
+            The raw values by key; a later parameter overrides an earlier one
+        """
+        extracted: Dict[str, Any] = {}
+        lookup = wanted.get
+        for param in params:
+            if not isinstance(param, dict):
+                continue
+            try:
+                key = lookup(param.get("process"))
+            except TypeError:
+                # Nicht hashbare Prozesswerte können keinem Feld entsprechen
+                continue
+            if key is not None:
+                extracted[key] = param.get("value")
+        return extracted
+
+    @staticmethod
+    def _extract_columns(
+        data_list: Iterable[Dict[str, Any]], wanted: Mapping[str, str]
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts the wanted processes of several elements as one column per key.
+
+        Parameters
+        ----------
+        data_list : Iterable[Dict[str, Any]]
+            The data of the elements
+        wanted : Mapping[str, str]
+            Mapping of process value to the column key
+
+        Returns
+        -------
+        Dict[str, List[Any]]
+            The raw values by key, None where an element lacks the process
+        """
+        columns: Dict[str, List[Any]] = {key: [] for key in wanted.values()}
+        appends = [(key, column.append) for key, column in columns.items()]
+        for data in data_list:
+            extracted = ElementValidator._extract_values(data.get("parameters", []), wanted)
+            for key, append in appends:
+                append(extracted.get(key))
+        return columns
+
     def _create_default_schema(self, element_type: ElementType) -> SchemaDefinition:
         """
         Creates a default schema for the specified element type.
@@ -372,7 +607,7 @@ class ElementValidator(GenericValidator):
             )
 
         # Spezifische Parameter für Linienelemente
-        if element_type in [ElementType.TRACK, ElementType.SEWER_PIPE]:
+        if element_type in _LINE_ELEMENT_TYPES:
             schema.required_params.update(
                 {
                     ProcessEnum.X_COORDINATE_END,
@@ -453,42 +688,29 @@ class ElementValidator(GenericValidator):
         """
         # Beispiel für eine spezifische Validierung:
         # Prüfen, ob Linienelemente Start- und Endpunkt unterscheiden
-        if element_type in [ElementType.TRACK, ElementType.SEWER_PIPE]:
+        if element_type in _LINE_ELEMENT_TYPES:
             # Parameter extrahieren
             params = data.get("parameters", [])
 
             # Koordinaten suchen
-            x, y, z = None, None, None
-            x_end, y_end, z_end = None, None, None
-
-            for param in params:
-                if isinstance(param, dict):
-                    process = param.get("process")
-                    value = param.get("value")
-
-                    if process == ProcessEnum.X_COORDINATE.value:
-                        x = value
-                    elif process == ProcessEnum.Y_COORDINATE.value:
-                        y = value
-                    elif process == ProcessEnum.Z_COORDINATE.value:
-                        z = value
-                    elif process == ProcessEnum.X_COORDINATE_END.value:
-                        x_end = value
-                    elif process == ProcessEnum.Y_COORDINATE_END.value:
-                        y_end = value
-                    elif process == ProcessEnum.Z_COORDINATE_END.value:
-                        z_end = value
-
-            # Wenn Start- und Endpunkt identisch sind, ist das verdächtig
-            if (
-                x is not None
-                and y is not None
-                and z is not None
-                and x_end is not None
-                and y_end is not None
-                and z_end is not None
-            ):
-                if x == x_end and y == y_end and z == z_end:
+            points = self._extract_values(params, _LINE_POINTS)
+
+            # Wenn Start- und Endpunkt identisch sind, ist das verdächtig;
+            # ohne alle sechs Koordinaten gibt es nichts zu vergleichen
+            if len(points) == len(_LINE_POINTS):
+                x, y, z = points["x"], points["y"], points["z"]
+                x_end, y_end, z_end = points["x_end"], points["y_end"], points["z_end"]
+                if (
+                    x is not None
+                    and y is not None
+                    and z is not None
+                    and x_end is not None
+                    and y_end is not None
+                    and z_end is not None
+                    and x == x_end
+                    and y == y_end
+                    and z == z_end
+                ):
                     result.add_warning(
                         ValidationWarning(
                             message="Start and end points are identical",
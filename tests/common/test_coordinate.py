@@ -0,0 +1,29 @@
+"""
+Tests for the coordinate helper functions in pyarm.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from pyarm.utils import coordinate as cs
+
+
+class TestCoordinate(unittest.TestCase):
+    """Test cases for the length calculation functions."""
+
+    def test_calculate_length(self):
+        """Test the distance between two points."""
+        self.assertAlmostEqual(cs.calculate_length((0, 0, 0), (3, 4, 0)), 5.0)
+        self.assertAlmostEqual(cs.calculate_length((1, 1, None), (1, 1, 2)), 2.0)
+
+    def test_calculate_length_requires_three_values(self):
+        """Test that incomplete points have no length."""
+        self.assertIsNone(cs.calculate_length((0, 0), (3, 4)))
+
+
+if __name__ == "__main__":
+    unittest.main()
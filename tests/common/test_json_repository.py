@@ -0,0 +1,101 @@
+"""
+Tests for the JSON element repository.
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from pyarm.models.element_models import Foundation, Mast
+from pyarm.models.parameter import DataType, Parameter, UnitEnum
+from pyarm.models.process_enums import ElementType, ProcessEnum
+from pyarm.repository.json.elements import JsonElementRepository
+
+
+def _create_parameters(x: float = 1.0, y: float = 2.0) -> list[Parameter]:
+    return [
+        Parameter("X", x, DataType.FLOAT, ProcessEnum.X_COORDINATE, UnitEnum.METER),
+        Parameter("Y", y, DataType.FLOAT, ProcessEnum.Y_COORDINATE, UnitEnum.METER),
+    ]
+
+
+class TestJsonElementRepository(unittest.TestCase):
+    """Test cases for the JsonElementRepository."""
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name)
+        self.repository = JsonElementRepository(str(self.path))
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_save_and_reload(self):
+        """Test that saved elements are loaded by a new repository."""
+        foundation = Foundation(name="F1", parameters=_create_parameters())
+        mast = Mast(name="M1", parameters=_create_parameters())
+        self.repository.save_all([foundation, mast])
+
+        reloaded = JsonElementRepository(str(self.path))
+        self.assertEqual(len(reloaded.get_all()), 2)
+        self.assertEqual(reloaded.get_by_id(foundation.uuid).name, "F1")
+        self.assertEqual(reloaded.get_by_id(str(mast.uuid)).name, "M1")
+        self.assertIsNone(reloaded.get_by_id("not-a-uuid"))
+        self.assertEqual([e.name for e in reloaded.get_by_type(ElementType.MAST)], ["M1"])
+
+    def test_save_writes_only_changed_type(self):
+        """Test that saving an element does not rewrite files of other types."""
+        self.repository.save(Foundation(name="F1", parameters=_create_parameters()))
+        foundation_file = self.path / "foundation.json"
+        foundation_file.write_text("[]", encoding="utf-8")
+
+        self.repository.save(Mast(name="M1", parameters=_create_parameters()))
+
+        self.assertEqual(foundation_file.read_text(encoding="utf-8"), "[]")
+        self.assertTrue((self.path / "mast.json").exists())
+
+    def test_pretty_output(self):
+        """Test that files are compact by default and indented on request."""
+        self.repository.save(Mast(name="M1", parameters=_create_parameters()))
+        self.assertNotIn("\n", (self.path / "mast.json").read_text(encoding="utf-8"))
+
+        pretty = JsonElementRepository(str(self.path), pretty=True)
+        pretty.save(Mast(name="M2", parameters=_create_parameters()))
+        self.assertIn("\n  ", (self.path / "mast.json").read_text(encoding="utf-8"))
+
+    def test_output_matches_orjson_format(self):
+        """Test that the json module writes non-ASCII text unescaped, as orjson does."""
+        self.repository.save(Mast(name="Mast Süd", parameters=_create_parameters()))
+
+        self.assertIn('"name":"Mast Süd"', (self.path / "mast.json").read_text(encoding="utf-8"))
+        reloaded = JsonElementRepository(str(self.path))
+        self.assertEqual(reloaded.get_all()[0].name, "Mast Süd")
+
+    def test_delete_last_element_of_type(self):
+        """Test that deleting the last element of a type empties its file."""
+        mast = Mast(name="M1", parameters=_create_parameters())
+        self.repository.save(mast)
+        self.repository.delete(mast.uuid)
+
+        reloaded = JsonElementRepository(str(self.path))
+        self.assertEqual(reloaded.get_all(), [])
+
+    def test_backup(self):
+        """Test that the backup contains an identical copy of every file."""
+        self.repository.save(Foundation(name="F1", parameters=_create_parameters()))
+        self.repository.save(Mast(name="M1", parameters=_create_parameters()))
+
+        backup_path = Path(self.repository.backup())
+        self.addCleanup(shutil.rmtree, backup_path)
+
+        for name in ("foundation.json", "mast.json"):
+            self.assertEqual((backup_path / name).read_bytes(), (self.path / name).read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Tests for the plugin discovery and configuration.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import ModuleType
+from unittest import mock
+
+# Add src to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from pyarm import plugins
+
+_PLUGIN_CLASS = """
+class {class_name}(PluginInterface):
+    name = "{name}"
+    version = "1.0"
+
+    def initialize(self, config):
+        return True
+
+    def get_supported_element_types(self):
+        return []
+
+    def load_data_from_directory(self, directory_path):
+        pass
+
+    def convert_element(self, element_type):
+        return None
+
+    def define_element_links(self, linker_manager):
+        pass
+"""
+
+
+def _plugin_source(*names: str, header: str = "") -> str:
+    """Creates the source of a plugin module with one plugin class per name."""
+    classes = [_PLUGIN_CLASS.format(class_name=f"Plugin{name}", name=name) for name in names]
+    imports = "from pyarm.interfaces.plugin import PluginInterface\n"
+    return imports + header + "".join(classes)
+
+
+def _plugin_module(name: str, *plugin_names: str) -> ModuleType:
+    """Creates an in-memory module defining one plugin class per name."""
+    module = ModuleType(name)
+    exec(_plugin_source(*plugin_names), vars(module))
+    return module
+
+
+class TestPluginConfiguration(unittest.TestCase):
+    """Test cases for reading the plugin configuration."""
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name)
+        plugins._clear_caches()
+
+    def tearDown(self):
+        plugins._clear_caches()
+        self._temp_dir.cleanup()
+
+    def test_plugin_settings_are_copies(self):
+        """Test that changing returned settings does not change the cached configuration."""
+        config_file = self.path / "plugins.json"
+        settings = {"client-a": {"options": {"strict": True}}}
+        config_file.write_text(json.dumps({"plugin_settings": settings}))
+
+        with mock.patch.dict(os.environ, {"PYARM_CONFIG": str(config_file)}):
+            first = plugins.get_plugin_settings("client-a")
+            first["options"]["strict"] = False
+            second = plugins.get_plugin_settings("client-a")
+
+        self.assertEqual(second, {"options": {"strict": True}})
+
+    def test_plugin_directory_created_later_is_found(self):
+        """Test that a configured plugin directory is found once it exists."""
+        plugin_dir = self.path / "client_plugins"
+        config_file = self.path / "plugins.json"
+        config = {"external_plugin_paths": [{"path": str(plugin_dir)}]}
+        config_file.write_text(json.dumps(config))
+
+        with mock.patch.dict(os.environ, {"PYARM_CONFIG": str(config_file)}):
+            before = plugins._get_custom_plugin_paths()
+            plugin_dir.mkdir()
+            after = plugins._get_custom_plugin_paths()
+
+        self.assertNotIn(str(plugin_dir), before)
+        self.assertIn(str(plugin_dir), after)
+
+
+class TestPluginDiscovery(unittest.TestCase):
+    """Test cases for discovering plugins in plugin directories."""
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name)
+        self._modules = set(sys.modules)
+        plugins._clear_caches()
+
+    def tearDown(self):
+        plugins._clear_caches()
+        for module_name in set(sys.modules) - self._modules:
+            del sys.modules[module_name]
+        self._temp_dir.cleanup()
+
+    def _write_plugin(self, package: str, source: str) -> Path:
+        plugin_dir = self.path / package
+        plugin_dir.mkdir(exist_ok=True)
+        init_file = plugin_dir / "__init__.py"
+        init_file.write_text(source)
+        return init_file
+
+    def _discover(self) -> dict:
+        return plugins._discover_plugins_in_directory(str(self.path))
+
+    def test_plugin_info_read_without_instantiating(self):
+        """Test that name and version class attributes are read without an instance."""
+        source = _plugin_source("quiet") + (
+            "\n\ndef _fail(self):\n    raise RuntimeError('instantiated')\n\n"
+            "Pluginquiet.__init__ = _fail\n"
+        )
+        self._write_plugin("discovery_info", source)
+
+        discovered = self._discover()
+
+        self.assertEqual(list(discovered), ["quiet"])
+
+    def test_every_plugin_class_of_a_package(self):
+        """Test that all plugin classes of one package are registered."""
+        self._write_plugin("discovery_many", _plugin_source("first", "second"))
+
+        discovered = self._discover()
+
+        self.assertEqual(sorted(discovered), ["first", "second"])
+
+    def test_plugin_class_attribute_selects_the_plugin(self):
+        """Test that PLUGIN_CLASS names the only plugin class of a package."""
+        source = _plugin_source("chosen", "helper") + "\nPLUGIN_CLASS = Pluginchosen\n"
+        self._write_plugin("discovery_selected", source)
+
+        discovered = self._discover()
+
+        self.assertEqual(list(discovered), ["chosen"])
+
+    def test_plugin_classes_of_imported_modules_are_ignored(self):
+        """Test that plugin classes defined in modules a plugin imports are not registered."""
+        shared_dir = self.path / "shared"
+        shared_dir.mkdir()
+        (shared_dir / "discovery_shared_base.py").write_text(_plugin_source("shared"))
+        header = "import discovery_shared_base  # noqa: F401\n"
+        self._write_plugin("discovery_own", _plugin_source("own", header=header))
+
+        with mock.patch.object(sys, "path", [str(shared_dir), *sys.path]):
+            discovered = self._discover()
+
+        self.assertEqual(list(discovered), ["own"])
+
+    def test_imported_plugin_classes_are_not_found_in_module(self):
+        """Test that a module without __all__ only returns its own plugin classes."""
+        shared = _plugin_module("discovery_shared", "shared")
+        module = _plugin_module("discovery_reexport", "own")
+        module.Pluginshared = shared.Pluginshared
+
+        found = plugins._find_plugin_classes(module)
+
+        self.assertEqual(found, (module.Pluginown,))
+
+    def test_plugin_classes_cached_until_package_changes(self):
+        """Test that an unchanged plugin package is not imported again."""
+        init_file = self._write_plugin("discovery_cached", _plugin_source("cached"))
+        self._discover()
+        module = sys.modules["discovery_cached"]
+
+        self.assertEqual(list(self._discover()), ["cached"])
+        self.assertIs(sys.modules["discovery_cached"], module)
+
+        init_file.write_text(_plugin_source("changed"))
+        stat = init_file.stat()
+        os.utime(init_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(list(self._discover()), ["changed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the element type guards in pyarm.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from pyarm.models.base_models import InfrastructureElement
+from pyarm.models.element_models import Mast
+from pyarm.models.parameter import DataType, Parameter, UnitEnum
+from pyarm.models.process_enums import ElementType, ProcessEnum
+from pyarm.utils import type_guards as tg
+
+
+def _create_parameters() -> list[Parameter]:
+    return [
+        Parameter("X", 1.0, DataType.FLOAT, ProcessEnum.X_COORDINATE, UnitEnum.METER),
+        Parameter("Y", 2.0, DataType.FLOAT, ProcessEnum.Y_COORDINATE, UnitEnum.METER),
+    ]
+
+
+class TestTypeGuards(unittest.TestCase):
+    """Test cases for the element type guards."""
+
+    def test_element_type_enum(self):
+        """Test that an element matches the guard of its element type."""
+        element = InfrastructureElement(
+            name="F1", element_type=ElementType.FOUNDATION, parameters=_create_parameters()
+        )
+        self.assertTrue(tg.is_foundation(element))
+        self.assertFalse(tg.is_mast(element))
+
+    def test_element_type_string(self):
+        """Test that an element type given as plain string matches as well."""
+        element = InfrastructureElement(
+            name="F1", element_type="foundation", parameters=_create_parameters()
+        )
+        self.assertTrue(tg.is_foundation(element))
+        self.assertFalse(tg.is_mast(element))
+
+    def test_element_class(self):
+        """Test that an instance of the element class matches and other objects do not."""
+        self.assertTrue(tg.is_mast(Mast(name="M1", parameters=_create_parameters())))
+        self.assertFalse(tg.is_mast("mast"))
+
+
+if __name__ == "__main__":
+    unittest.main()
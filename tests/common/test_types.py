@@ -0,0 +1,67 @@
+"""
+Tests for the value type checks in pyarm.
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add src to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from pyarm.utils import types
+
+
+class TestTypes(unittest.TestCase):
+    """Test cases for the value type checks."""
+
+    def test_is_int(self):
+        """Test integer detection for numbers and strings."""
+        for value in (5, "12", "-12", "1,0", " 7 ", 2.0):
+            self.assertTrue(types.is_int(value), value)
+        for value in (None, True, "3.5", "+-5", "", "abc"):
+            self.assertFalse(types.is_int(value), value)
+
+    def test_is_float(self):
+        """Test float detection for numbers and strings."""
+        for value in (5, 2.5, "3.5", "1,5", "-12"):
+            self.assertTrue(types.is_float(value), value)
+        for value in (None, False, "", "abc"):
+            self.assertFalse(types.is_float(value), value)
+
+    def test_bool_values(self):
+        """Test boolean detection and conversion of strings."""
+        self.assertTrue(types.is_bool("Ja") and types.is_bool("off") and types.is_bool(False))
+        self.assertFalse(types.is_bool("maybe") or types.is_bool(None))
+        self.assertTrue(types.as_bool("YES") and types.as_bool(1))
+        self.assertFalse(types.as_bool("nein") or types.as_bool("maybe"))
+
+    def test_common_flag(self):
+        """Test the first type that holds for a whole column of values."""
+        self.assertEqual(types.common_flag(["2", 3, "1,0"]), types.INT_FLAG)
+        self.assertEqual(types.common_flag(["2", "2.5"]), types.FLOAT_FLAG)
+        self.assertEqual(types.common_flag(["ja", "off", True]), types.BOOL_FLAG)
+        self.assertEqual(types.common_flag(["1", "0"], types.BOOL_FLAG), types.BOOL_FLAG)
+        self.assertEqual(types.common_flag(["2", "abc", [1]]), 0)
+
+    def test_common_flag_stops_early_on_string_column(self):
+        """Test that a high-cardinality string column is not checked value by value."""
+        values = [f"name {index}" for index in range(100_000)]
+
+        start = time.perf_counter()
+        flag = types.common_flag(values)
+        elapsed = time.perf_counter() - start
+
+        # Reference: one check on every value, the least a per-value classification costs
+        start = time.perf_counter()
+        for value in values:
+            types.is_float(value)
+        single_pass = time.perf_counter() - start
+
+        self.assertEqual(flag, 0)
+        self.assertLess(elapsed, single_pass)
+
+
+if __name__ == "__main__":
+    unittest.main()
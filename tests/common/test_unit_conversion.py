@@ -49,6 +49,14 @@ class TestUnitConversion(unittest.TestCase):
         # Test kilometer to meter
         self.assertAlmostEqual(units.convert_unit(1, UnitEnum.KILOMETER, UnitEnum.METER), 1000)
 
+    def test_decimal_conversions_are_exact(self):
+        """Test that scaling by powers of ten gives the same result as written by hand."""
+        convert = units.convert_unit
+        self.assertEqual(convert(3, UnitEnum.MILLIMETER, UnitEnum.CENTIMETER), 0.3)
+        self.assertEqual(convert(1, UnitEnum.SQUARE_CENTIMETER, UnitEnum.SQUARE_MILLIMETER), 100.0)
+        self.assertEqual(convert(0.7, UnitEnum.METER, UnitEnum.MILLIMETER), 700.0)
+        self.assertEqual(convert(36, UnitEnum.KILOMETER_PER_HOUR, UnitEnum.METER_PER_SECOND), 10.0)
+
     def test_area_conversion(self):
         """Test conversion between area units."""
         # Test square meter to square centimeter
@@ -104,6 +112,12 @@ class TestUnitConversion(unittest.TestCase):
         with self.assertRaises(ValueError):
             units.convert_unit(1, UnitEnum.DEGREE, UnitEnum.SECOND)
 
+        with self.assertRaises(ValueError):
+            units.convert_unit(1, UnitEnum.CELSIUS, UnitEnum.METER)
+
+        with self.assertRaises(ValueError):
+            units.convert_unit(1, UnitEnum.METER, UnitEnum.KELVIN)
+
     def test_parameter_unit_conversion(self):
         """Test conversion of a Parameter's unit."""
         # Create a parameter with meters
@@ -128,6 +142,48 @@ class TestUnitConversion(unittest.TestCase):
         self.assertEqual(param.value, 1.0)
         self.assertEqual(param.unit, UnitEnum.METER)
 
+    def test_parameter_unit_conversion_shares_components(self):
+        """Test that converted parameters copy shared components on write."""
+        from pyarm.components import Component, ComponentType
+
+        param = Parameter(
+            name="Length",
+            value=1.0,
+            datatype=DataType.FLOAT,
+            unit=UnitEnum.METER,
+            components={"note": Component("note", ComponentType.CUSTOM)},
+        )
+
+        converted = units.convert_parameter_unit(param, UnitEnum.CENTIMETER)
+        self.assertIs(converted.components, param.components)
+
+        converted.add_component(Component("extra", ComponentType.CUSTOM))
+        self.assertIn("extra", converted.components)
+        self.assertNotIn("extra", param.components)
+
+        param.remove_component("note")
+        self.assertNotIn("note", param.components)
+        self.assertIn("note", converted.components)
+
+    def test_parameter_unit_conversion_without_components(self):
+        """Test that converted parameters without components do not share a dict."""
+        from pyarm.components import Component, ComponentType
+
+        param = Parameter(
+            name="Length",
+            value=1.0,
+            datatype=DataType.FLOAT,
+            unit=UnitEnum.METER,
+        )
+
+        converted = units.convert_parameter_unit(param, UnitEnum.CENTIMETER)
+        converted.add_component(Component("extra", ComponentType.CUSTOM))
+        self.assertIn("extra", converted.components)
+        self.assertEqual(param.components, {})
+
+        param.add_component(Component("note", ComponentType.CUSTOM))
+        self.assertNotIn("note", converted.components)
+
     def test_convert_parameter_list(self):
         """Test conversion of a list of Parameters."""
         # Create parameters with different units
@@ -187,6 +243,20 @@ class TestUnitConversion(unittest.TestCase):
         self.assertEqual(converted[3].value, "Test")
         self.assertEqual(converted[3].unit, UnitEnum.NONE)
 
+    def test_convert_parameter_list_keeps_unconvertible(self):
+        """Test that parameters with an unsupported unit pair are kept unchanged."""
+        params = [
+            Parameter(name="Slope", value=2.0, datatype=DataType.FLOAT, unit=UnitEnum.PERCENT),
+            Parameter(name="Length", value=1.0, datatype=DataType.FLOAT, unit=UnitEnum.METER),
+        ]
+
+        unit_map = {UnitEnum.PERCENT: UnitEnum.SECOND, UnitEnum.METER: UnitEnum.MILLIMETER}
+        converted = units.convert_parameter_list_units(params, unit_map)
+
+        self.assertIs(converted[0], params[0])
+        self.assertAlmostEqual(converted[1].value, 1000.0)
+        self.assertEqual(converted[1].unit, UnitEnum.MILLIMETER)
+
     def test_standardize_units(self):
         """Test standardization of units in a parameter list."""
         params = [
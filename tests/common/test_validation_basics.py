@@ -4,10 +4,19 @@ Basic tests for the validation system.
 This module contains tests for the basic validation functionality.
 """
 
+import logging
+import multiprocessing
+
 import pytest
 from typing import Dict, Any
 
-from pyarm.validation.errors import ErrorSeverity, ValidationError, ValidationResult
+from pyarm.validation import service as service_module
+from pyarm.validation.errors import (
+    ErrorSeverity,
+    ValidationError,
+    ValidationResult,
+    ValidationWarning,
+)
 from pyarm.validation.service import ValidationService
 from pyarm.validation.interfaces import IValidator
 
@@ -208,4 +217,123 @@ class TestValidationBasics:
         assert "error_types" in report
         error_messages = [error["message"] for error in report["error_types"]]
         assert "Field 'id' must be a string" in error_messages
-        assert "Required field 'name' is missing" in error_messages
\ No newline at end of file
+        assert "Required field 'name' is missing" in error_messages
+
+    def test_result_has_errors_by_severity(self):
+        """
+        Test: A result reports errors at or above a minimum severity.
+        """
+        # GIVEN a result with only a warning-level error
+        result = ValidationResult()
+        result.add_error(ValidationError("Minor issue", {}, severity=ErrorSeverity.WARNING))
+
+        # THEN it stays valid and only counts as error for the lowest severity
+        assert result.is_valid
+        assert not result.has_errors()
+        assert result.has_errors(ErrorSeverity.WARNING)
+
+    def test_critical_errors_logged_at_error_level(self, caplog):
+        """
+        Test: Critical errors are logged when the logger only shows errors.
+        """
+        # GIVEN a logger that only shows errors
+        caplog.set_level(logging.ERROR, logger="pyarm.validation.service")
+
+        # WHEN validating an element with a critical and an ordinary error
+        self.service.validate_collection(["string", {"id": 2, "name": "B"}], "foundation")
+
+        # THEN only the critical error is logged
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("Kritischer Validierungsfehler" in message for message in messages)
+        assert not any(message.startswith("Validierungsfehler") for message in messages)
+
+    def test_result_keeps_dataclass_fields(self):
+        """
+        Test: Warnings can be passed to a result and show up in its repr.
+        """
+        # GIVEN a result created with a warning and a warning added later
+        result = ValidationResult(warnings=[ValidationWarning("First", {})])
+        result.add_warning(ValidationWarning("Second", {}))
+
+        # WHEN merging it into another result
+        merged = ValidationResult()
+        merged.merge(result)
+
+        # THEN the repr shows both warnings in order
+        assert "First" in repr(merged)
+        assert [warning.message for warning in merged.warnings] == ["First", "Second"]
+
+    def test_result_errors_and_warnings_are_lists(self):
+        """
+        Test: Errors and warnings of a new result can be extended directly.
+        """
+        # GIVEN two new results
+        result = ValidationResult()
+        other = ValidationResult()
+
+        # WHEN appending to their lists directly
+        result.errors.append(ValidationError("Direct", {}))
+        result.warnings.extend([ValidationWarning("Direct", {})])
+
+        # THEN each result has its own lists
+        assert len(result.errors) == 1 and len(result.warnings) == 1
+        assert other.errors == [] and other.warnings == []
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="fork is not available"
+    )
+    def test_collection_validated_in_workers_matches_sequential(self, monkeypatch):
+        """
+        Test: A collection split across worker processes gives the same results.
+        """
+        # GIVEN a platform whose default start method is forkserver, as from Python 3.14
+        get_context = multiprocessing.get_context
+        monkeypatch.setattr(
+            multiprocessing, "get_context", lambda method=None: get_context(method or "forkserver")
+        )
+        start_methods = []
+
+        class RecordingExecutor(service_module.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                start_methods.append(kwargs["mp_context"].get_start_method())
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(service_module, "ProcessPoolExecutor", RecordingExecutor)
+
+        # AND a service with worker processes and a collection above its threshold
+        service = ValidationService(max_workers=2)
+        service.register_validator(self.validator)
+        service.PARALLEL_MIN_ELEMENTS = 4
+        service.PARALLEL_MIN_CHUNK = 2
+        collection = [{"id": "1", "name": "A"}, {"id": 2, "name": "B"}, {"name": "C"}] * 2
+
+        # WHEN validating the collection
+        results = service.validate_collection(collection, "foundation")
+        expected = self.service.validate_collection(collection, "foundation")
+
+        # THEN it is validated on forked worker processes
+        assert start_methods == ["fork"]
+
+        # AND the results match the sequential validation in input order
+        assert [r.is_valid for r in results] == [r.is_valid for r in expected]
+        assert [[e.message for e in r.errors] for r in results] == [
+            [e.message for e in r.errors] for r in expected
+        ]
+
+    def test_collection_validated_serially_without_fork(self, monkeypatch):
+        """
+        Test: Without fork as start method the collection is validated in-process.
+        """
+        # GIVEN a platform that cannot fork
+        monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+        monkeypatch.setattr(service_module, "ProcessPoolExecutor", None)
+        service = ValidationService(max_workers=2)
+        service.register_validator(self.validator)
+        service.PARALLEL_MIN_ELEMENTS = 2
+        collection = [{"id": "1", "name": "A"}, {"id": 2, "name": "B"}]
+
+        # WHEN validating the collection
+        results = service.validate_collection(collection, "foundation")
+
+        # THEN it is validated without worker processes
+        assert [r.is_valid for r in results] == [True, False]
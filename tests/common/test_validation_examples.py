@@ -0,0 +1,148 @@
+"""
+Tests for the example validators.
+
+This module contains tests for the foundation, mast and track validators.
+"""
+
+import numpy as np
+import pytest
+
+from pyarm.validation import examples
+from pyarm.validation.examples import get_foundation_validator, get_track_validator
+from pyarm.validation.service import ValidationService
+
+
+def _element(index, **values):
+    """Creates element data with one parameter per process."""
+    parameters = [
+        {"name": process, "value": value, "process": process} for process, value in values.items()
+    ]
+    return {"uuid": f"E{index}", "parameters": parameters}
+
+
+def _messages(results):
+    return [[warning.message for warning in result.warnings] for result in results]
+
+
+# Columns x, y, z, x_end, y_end, z_end of a plausible, a short, a steep and a
+# vertical track and a track without x_end
+_TRACK_COORDINATES = [
+    [0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 0.0],
+    [100.0, 0.5, 10.0, 0.0, None],
+    [0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 5.0, 1.0],
+]
+
+
+def _numpy_track_candidates(monkeypatch, coordinates):
+    """Track candidates of the NumPy path, also when numba is installed."""
+    with monkeypatch.context() as patch:
+        patch.setattr(examples, "njit", None)
+        return examples._track_candidates(coordinates).tolist()
+
+
+class TestExampleValidators:
+    """
+    Tests for the example validators.
+    """
+
+    def setup_method(self):
+        """
+        Set up a test environment.
+        """
+        self.service = ValidationService()
+        self.service.register_validator(get_foundation_validator())
+        self.service.register_validator(get_track_validator())
+
+    def test_vectorized_collection_matches_collection(self):
+        """
+        Test: The vectorized collection validation reports the same warnings.
+        """
+        # GIVEN foundations and tracks with plausible and conspicuous values
+        foundations = [
+            _element(1, width=2.0, height=1.0, depth=2.0),
+            _element(2, width=0.2, height=0.3, depth=0.5),
+            _element(3, width=0.5, height=4.0, depth=1.0),
+            _element(4, width=2.0, height=None, depth=2.0),
+        ]
+        tracks = [
+            _element(
+                1,
+                x_coordinate=1.0,
+                y_coordinate=1.0,
+                z_coordinate=1.0,
+                x_coordinate_end=101.0,
+                y_coordinate_end=1.0,
+                z_coordinate_end=1.0,
+            ),
+            _element(
+                2,
+                x_coordinate=1.0,
+                y_coordinate=1.0,
+                z_coordinate=1.0,
+                x_coordinate_end=1.5,
+                y_coordinate_end=1.0,
+                z_coordinate_end=1.0,
+            ),
+            _element(
+                3,
+                x_coordinate=1.0,
+                y_coordinate=1.0,
+                z_coordinate=1.0,
+                x_coordinate_end=11.0,
+                y_coordinate_end=1.0,
+                z_coordinate_end=2.0,
+                track_type="Hauptgleis",
+                track_gauge=1.0,
+            ),
+            _element(4, x_coordinate=1.0, y_coordinate=1.0),
+        ]
+
+        for data, element_type in ((foundations, "foundation"), (tracks, "track")):
+            # WHEN validating per element and vectorized
+            expected = self.service.validate_collection(data, element_type)
+            actual = self.service.validate_collection_vectorized(data, element_type)
+
+            # THEN both report the same warnings in the same order
+            assert _messages(actual) == _messages(expected)
+            assert [r.is_valid for r in actual] == [r.is_valid for r in expected]
+
+        foundation_messages = _messages(
+            self.service.validate_collection_vectorized(foundations, "foundation")
+        )
+        assert foundation_messages[0] == []
+        assert "Foundation-Volumen ist sehr klein: 0.03m³" in foundation_messages[1]
+        assert "Ungewöhnliches Höhe-zu-Breite-Verhältnis: 8.00" in foundation_messages[2]
+
+        track_messages = _messages(actual)
+        assert "Gleislänge ist sehr kurz: 0.50m" in track_messages[1]
+        assert "Gleissteigung ist sehr steil: 10.00%" in track_messages[2]
+
+    def test_track_kernel_matches_numpy_path(self, monkeypatch):
+        """
+        Test: The track kernel flags the same tracks as the NumPy expression.
+        """
+        # GIVEN plausible, short, steep and vertical tracks and a missing value
+        columns = [np.array(c, dtype=np.float64) for c in _TRACK_COORDINATES]
+
+        # WHEN running the kernel, compiled only if numba is installed
+        flags = examples._track_flags_kernel(*columns)
+
+        # THEN it flags the same tracks as the NumPy path
+        expected = _numpy_track_candidates(monkeypatch, _TRACK_COORDINATES)
+        assert np.flatnonzero(flags).tolist() == expected == [1, 2]
+
+    def test_compiled_track_kernel_matches_numpy_path(self, monkeypatch):
+        """
+        Test: With numba, the track candidates come from the compiled kernel.
+        """
+        pytest.importorskip("numba")
+
+        # WHEN screening the tracks with and without the compiled kernel
+        compiled = examples._track_candidates(_TRACK_COORDINATES).tolist()
+
+        # THEN the kernel is compiled and both paths agree
+        assert hasattr(examples._track_flags_kernel, "py_func")
+        assert compiled == _numpy_track_candidates(monkeypatch, _TRACK_COORDINATES)